@@ -1,5 +1,6 @@
 from collections import OrderedDict
 from collections.abc import Hashable
+from itertools import product
 from typing import List, Optional
 
 from amads.core.basics import Note, Score
@@ -46,7 +47,7 @@ class MelodyTokenizer:
             raise ValueError("Score must be monophonic")
 
         flattened_score = score.flatten(collapse=True)
-        notes = list(flattened_score.find_all(Note))
+        notes = flattened_score.list_all(Note)
 
         # Clear any previous IOI data
         self.ioi_data = {}
@@ -250,6 +251,20 @@ class FantasticTokenizer(MelodyTokenizer):
 class MType:
     """A class for representing M-Types."""
 
+    __slots__ = ("pitch_interval_class", "ioi_ratio_class", "integer")
+
+    # The code of every (pitch interval class, IOI ratio class) pair, in
+    # the order produced by encode(), so that construction is one lookup
+    _INTEGER_TABLE = {
+        classes: integer
+        for integer, classes in enumerate(
+            product(
+                FantasticTokenizer.interval_classes,
+                FantasticTokenizer.ioi_ratio_classes,
+            )
+        )
+    }
+
     def __init__(
         self,
         pitch_interval_class: Optional[str],
@@ -257,7 +272,7 @@ class MType:
     ):
         self.pitch_interval_class = pitch_interval_class
         self.ioi_ratio_class = ioi_ratio_class
-        self.integer = self.encode()
+        self.integer = MType._INTEGER_TABLE[pitch_interval_class, ioi_ratio_class]
 
     def encode(self) -> int:
         n_ioi_ratio_classes = len(FantasticTokenizer.ioi_ratio_classes)
@@ -10,6 +10,7 @@ class NGramCounter:
     def __init__(self):
         """Initialize an empty n-gram counter."""
         self.ngram_counts = {}  # Initialize with empty dictionary instead of None
+        self._max_n = 0
 
     def count_ngrams(self, tokens: list, n: Union[int, list, None] = None) -> None:
         """Update n-gram counts from a sequence of tokens.
@@ -49,17 +50,29 @@ class NGramCounter:
                     )
             n_values = n
 
-        # Count n-grams and update the counter
+        # Count n-grams of each length: zipping n staggered slices of the
+        # (stringified) tokens yields the hashable n-grams in order
+        tokens = [str(token) for token in tokens]
+        counts = Counter()
+        update = counts.update
         for n in n_values:
-            for i in range(len(tokens) - n + 1):
-                # Create hashable n-gram
-                ngram = tuple(str(token) for token in tokens[i : i + n])
-                # Update count in the dictionary
-                self.ngram_counts[ngram] = self.ngram_counts.get(ngram, 0) + 1
+            update(zip(*(tokens[i:] for i in range(n))))
+
+        # Merge into the accumulated counts
+        ngram_counts = self.ngram_counts
+        for ngram, count in counts.items():
+            ngram_counts[ngram] = ngram_counts.get(ngram, 0) + count
+        self._max_n = max(self._max_n, max(map(len, counts), default=0))
 
     def reset(self) -> None:
         """Reset the n-gram counter to empty."""
         self.ngram_counts = {}
+        self._max_n = 0
+
+    @property
+    def max_n(self) -> int:
+        """Length of the longest n-grams counted since the last reset (0 if none)."""
+        return self._max_n
 
     def get_counts(self, n: Optional[int] = None) -> Dict:
         """Get the current n-gram counts.
@@ -79,6 +92,13 @@ class NGramCounter:
             return self.ngram_counts.copy()
         return {k: v for k, v in self.ngram_counts.items() if len(k) == n}
 
+    def _counts_array(self) -> np.ndarray:
+        """The current n-gram counts as an integer array, for the arithmetic
+        reductions in the statistics below."""
+        return np.fromiter(
+            self.ngram_counts.values(), dtype=np.int64, count=len(self.ngram_counts)
+        )
+
     @property
     def yules_k(self) -> float:
         """Calculate Yule's K statistic for the n-gram counts.
@@ -109,14 +129,15 @@ class NGramCounter:
                 "N-gram counts have not been calculated. Call count_ngrams() first."
             )
 
-        n_lengths = len(self.ngram_counts)
-        freq_spec = Counter(self.ngram_counts.values())
-        n = sum(self.ngram_counts.values())
+        counts = self._counts_array()
+        n_lengths = len(counts)
+        n = int(counts.sum())
         if n == 0:
             raise ValueError("Cannot calculate Yule's K for empty sequence")
 
-        # Calculate sum(vm * m²) where vm is frequency of value m
-        vm_m2_sum = sum(freq * (count * count) for count, freq in freq_spec.items())
+        # Calculate sum(vm * m²) where vm is frequency of value m, which is
+        # the sum of the squared counts
+        vm_m2_sum = int(np.dot(counts, counts))
 
         # Calculate K with scaling factor of 1000
         k = (1 / n_lengths) * (1000 * (vm_m2_sum - n) / (n * n))
@@ -149,22 +170,19 @@ class NGramCounter:
                 "N-gram counts have not been calculated. Call count_ngrams() first."
             )
 
-        n_lengths = len(self.ngram_counts)
-        n = sum(self.ngram_counts.values())
-        if n == 0:
+        counts = self._counts_array()
+        n_lengths = len(counts)
+        total_tokens = int(counts.sum())
+        if total_tokens == 0:
             raise ValueError("Cannot calculate Simpson's D for empty sequence")
 
-        # Get counts
-        count_values = list(self.ngram_counts.values())
-        total_tokens = sum(count_values)
-
         if total_tokens <= 1:
             raise ValueError("Cannot calculate Simpson's D for sequence of length <= 1")
 
         # Calculate D using the formula: 1 / |n| * sum(n_i * (n_i - 1)) / (total_tokens * (total_tokens - 1))
         d = (
             (1 / n_lengths)
-            * sum(n * (n - 1) for n in count_values)
+            * int(np.dot(counts, counts - 1))
             / (total_tokens * (total_tokens - 1))
         )
 
@@ -196,16 +214,16 @@ class NGramCounter:
                 "N-gram counts have not been calculated. Call count_ngrams() first."
             )
 
-        n_lengths = len(self.ngram_counts)
-        n = sum(self.ngram_counts.values())
-        if n == 0:
+        counts = list(self.ngram_counts.values())
+        n_lengths = len(counts)
+        if sum(counts) == 0:
             raise ValueError("Cannot calculate Sichel's S for empty sequence")
 
         # Count how many n-grams occur exactly twice
-        doubles = sum(1 for count in self.ngram_counts.values() if count == 2)
+        doubles = counts.count(2)
 
         # Get total_types (total number of unique n-grams)
-        total_types = len(self.ngram_counts)
+        total_types = len(counts)
 
         if total_types == 0:
             raise ValueError("Cannot calculate Sichel's S when no types exist")
@@ -244,15 +262,16 @@ class NGramCounter:
                 "N-gram counts have not been calculated. Call count_ngrams() first."
             )
 
-        n = sum(self.ngram_counts.values())
+        counts = list(self.ngram_counts.values())
+        n = sum(counts)
         if n == 0:
             raise ValueError("Cannot calculate Honore's H for empty sequence")
 
         # Get hapax_count (number of hapax legomena)
-        hapax_count = sum(1 for count in self.ngram_counts.values() if count == 1)
+        hapax_count = counts.count(1)
 
         # Get total_types
-        total_types = len(self.ngram_counts)
+        total_types = len(counts)
 
         # Handle edge cases
         if total_types == 0 or hapax_count == 0 or hapax_count == total_types:
@@ -298,12 +317,13 @@ class NGramCounter:
                 "N-gram counts have not been calculated. Call count_ngrams() first."
             )
 
-        total_tokens = sum(self.ngram_counts.values())
+        counts = self._counts_array()
+        total_tokens = int(counts.sum())
         if total_tokens <= 1:
             raise ValueError("Cannot calculate entropy for sequence of length <= 1")
 
         # Calculate probabilities
-        probabilities = [count / total_tokens for count in self.ngram_counts.values()]
+        probabilities = counts / total_tokens
 
         # Calculate entropy
         entropy = -np.sum(probabilities * np.log2(probabilities))
@@ -340,12 +360,13 @@ class NGramCounter:
                 "N-gram counts have not been calculated. Call count_ngrams() first."
             )
 
-        total_tokens = sum(self.ngram_counts.values())
+        counts = list(self.ngram_counts.values())
+        total_tokens = sum(counts)
         if total_tokens == 0:
             raise ValueError("Cannot calculate productivity for empty sequence")
 
         # Count hapax_count (types occurring once)
-        hapax_count = sum(1 for count in self.ngram_counts.values() if count == 1)
+        hapax_count = counts.count(1)
 
         # Calculate productivity
         productivity = hapax_count / total_tokens
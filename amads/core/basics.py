@@ -56,13 +56,85 @@ work:
 """
 
 import copy
+import sys
+from bisect import bisect_right
+from dataclasses import dataclass
 from math import floor
 from numbers import Number
+from operator import attrgetter
 from typing import Generator, Optional, Type, Union
 
+import numpy as np
+
 from amads.core.pitch import Pitch
 from amads.core.timemap import TimeMap
 
+# key function for searching EventGroup content, which is sorted by onset
+_event_onset = attrgetter("onset")
+
+# accessors used by EventGroup.note_arrays() and _sort_notes()
+_note_onset = attrgetter("_onset")
+_note_duration = attrgetter("duration")
+_note_key_num = attrgetter("pitch.key_num")
+_note_alt = attrgetter("pitch.alt")
+
+# Values of these types are immutable (Pitch is nominally immutable and
+# is shared between Notes), so Event.__deepcopy__ shares rather than
+# copies them. Other Number types, e.g. numpy.float64 times from MIDI
+# import, are added when they are first encountered.
+_SHARED_TYPES = {type(None), bool, int, float, str, Pitch}
+
+_UNSET = object()  # marks a slot that has no value
+
+_SLOT_NAMES = {}  # maps each class to the names of all its slots
+
+
+def _slot_names(cls: type) -> list[str]:
+    """Return the names of all slots of cls, including inherited ones."""
+    names = _SLOT_NAMES.get(cls)
+    if names is None:
+        names = []
+        for base in cls.__mro__:
+            slots = base.__dict__.get("__slots__", ())
+            if isinstance(slots, str):
+                slots = [slots]
+            names += [slot for slot in slots if slot not in names and
+                      slot not in ("__dict__", "__weakref__")]
+        _SLOT_NAMES[cls] = names
+    return names
+
+
+def _sort_notes(notes: list["Note"]) -> list["Note"]:
+    """Return notes sorted by onset and then pitch, the same order as
+    sorted(notes, key=lambda x: (x.onset, x.pitch)), but computed with
+    a (stable) np.lexsort instead of comparing tuples of Pitches.
+    """
+    n = len(notes)
+    onsets = np.fromiter(map(_note_onset, notes), np.float64, n)
+    key_nums = np.fromiter(map(_note_key_num, notes), np.float64, n)
+    # Pitch order is by key_num and then by decreasing alt (see Pitch.__lt__)
+    alts = -np.fromiter(map(_note_alt, notes), np.float64, n)
+    order = np.lexsort((alts, key_nums, onsets)).tolist()  # Python ints
+    return [notes[i] for i in order]
+
+
+def _selector(spec, match_str: bool):
+    """Return a function selected(i, event) that tests whether event, the
+    i-th Part or Staff, is selected by spec as described in
+    Score.collapse_parts(): None selects all, an int selects by number, a
+    str selects by instrument (only if match_str), and [i] selects by index.
+    """
+    if spec is None:
+        return lambda i, event: True
+    if isinstance(spec, int):
+        return lambda i, event: event.number == spec
+    if isinstance(spec, str) and match_str:
+        return lambda i, event: event.instrument == spec
+    if isinstance(spec, list):
+        index = spec[0]
+        return lambda i, event: i == index
+    return lambda i, event: False  # spec matches nothing
+
 
 class Event:
     """A superclass for Note, Rest, EventGroup, and just about
@@ -89,6 +161,7 @@ class Event:
             Additional attribute/value information.
     """
     __slots__ = ["parent", "_onset", "duration", "info"]
+    _TAG = 1 << 0
 
     def __init__(self, parent: Optional["EventGroup"],
                  onset: float, duration: float):
@@ -173,6 +246,66 @@ class Event:
         return property in self.info
 
 
+    def __deepcopy__(self, memo: dict) -> "Event":
+        """Return a deep copy of the Event instance. This is called by
+        copy.deepcopy() (see copy()). Rather than the generic copy
+        protocol, we copy each slot directly, sharing immutable values
+        such as Pitch objects and recursively copying the rest, such
+        as EventGroup content.
+
+        Parameters
+        ----------
+        memo : dict
+            A dictionary to keep track of already copied objects.
+
+        Returns
+        -------
+        Event
+            A deep copy of the Event instance.
+        """
+        cls = self.__class__
+        result = cls.__new__(cls)
+        memo[id(self)] = result
+        for slot in _slot_names(cls):
+            value = getattr(self, slot, _UNSET)
+            if value is _UNSET:
+                continue
+            value_type = type(value)
+            if value_type not in _SHARED_TYPES:
+                if issubclass(value_type, Number):
+                    _SHARED_TYPES.add(value_type)
+                else:
+                    value = copy.deepcopy(value, memo)
+            setattr(result, slot, value)
+        # classes without __slots__, e.g. Concurrence, also have a __dict__
+        state = getattr(self, "__dict__", None)
+        if state:
+            result.__dict__.update(copy.deepcopy(state, memo))
+        return result
+
+
+    def __copy__(self) -> "Event":
+        """Return a shallow copy of the Event instance. This is called by
+        copy.copy(). All attributes, including parent (and content of an
+        EventGroup), are shared with the original.
+
+        Returns
+        -------
+        Event
+            A shallow copy of the Event instance.
+        """
+        cls = self.__class__
+        result = cls.__new__(cls)
+        for slot in _slot_names(cls):
+            value = getattr(self, slot, _UNSET)
+            if value is not _UNSET:
+                setattr(result, slot, value)
+        state = getattr(self, "__dict__", None)
+        if state:
+            result.__dict__.update(state)
+        return result
+
+
     def copy(self, parent: Optional["EventGroup"] = None) -> "Event":
         """
         Return a deep copy of the Event instance except for the parent,
@@ -188,7 +321,9 @@ class Event:
         # preventing deep copy from copying the entire tree
         original_parent = self.parent
         self.parent = None
-        c = copy.deepcopy(self)  # deep copy of this event down to leaf nodes
+        # deep copy of this event down to leaf nodes; calling __deepcopy__
+        # directly skips the dispatch in copy.deepcopy for the top node
+        c = self.__deepcopy__({})
         self.parent = original_parent  # restore link to parent
         if parent:
             parent.insert(c)
@@ -440,6 +575,7 @@ class Rest(Event):
             The duration of the rest in quarters or seconds.
     """
     __slots__ = []
+    _TAG = 1 << 1
 
     def __init__(self, parent: Optional["EventGroup"] = None,
                  onset: Optional[float] = None, duration: float = 1):
@@ -466,7 +602,7 @@ class Rest(Event):
             The Rest instance itself.
         """
 
-        print(" " * indent, self, sep="")
+        sys.stdout.write(f"{' ' * indent}{self}\n")
         return self
 
 
@@ -513,6 +649,7 @@ class Note(Event):
             The note that this note is tied to, if any.
     """
     __slots__ = ["pitch", "dynamic", "lyric", "tie"]
+    _TAG = 1 << 2
 
     def __init__(self,
                  parent: Optional["EventGroup"] = None,
@@ -535,64 +672,6 @@ class Note(Event):
         self.tie = None
 
 
-    def __deepcopy__(self, memo: bool = None) -> "Note":
-        """Return a deep copy of the Note instance. The pitch is
-        shallow copied to avoid copying the entire Pitch object.
-
-        Parameters
-        ----------
-        memo : bool, optional
-            A dictionary to keep track of already copied objects.
-            (Defaults to None)
-
-        Returns
-        -------
-        Note
-            A deep copy of the Note instance with a shallow copy of the pitch.
-        """
-        cls = self.__class__
-        result = cls.__new__(cls)
-        memo[id(self)] = result
-
-
-    def __deepcopy__(self, memo):
-        """Return a deep copy of the Note instance. The pitch is
-        shallow copied to avoid copying the entire Pitch object.
-
-        Parameters
-        ----------
-        memo : dict
-            A dictionary to keep track of already copied objects.
-
-        Returns
-        -------
-        Note
-            A deep copy of the Note instance with a shallow copy of the pitch.
-        """
-        cls = self.__class__
-        result = cls.__new__(cls)
-        memo[id(self)] = result
-
-        # Iterate up the superclass chain and copy __slots__ at each level
-        # If there is a __dict__, it will be in a __slots__ and will be deep
-        # copied, so all attributes in __dict__ will be copied. If there is
-        # multiple inheritance with duplicated slots, this will copy the
-        # duplicated slot two (or more) times, but it should get the right
-        # result.
-        for base in cls.__mro__:
-            if hasattr(base, '__slots__'):
-                slots = base.__slots__
-                if isinstance(slots, str):
-                    slots = [slots]
-                for slot in slots:
-                    if slot == "pitch":
-                        result.pitch = self.pitch
-                    else:
-                        setattr(result, slot,
-                                copy.deepcopy(getattr(self, slot), memo))
-
-        return result
-
     @property
     def tied_duration(self) -> float:
         """Retrieve the duration of the note in quarters or seconds.
@@ -649,7 +728,7 @@ class Note(Event):
             tie_info = " tied"
         tie_prefix = "  tied to " if tied else ""
 
-        print(" " * indent, tie_prefix, self, tie_info, sep="")
+        sys.stdout.write(f"{' ' * indent}{tie_prefix}{self}{tie_info}\n")
         if self.tie:
             self.tie.show(indent + 2, tied=True)
         return self
@@ -710,7 +789,7 @@ class Note(Event):
         int
             The octave number of the note.
         """
-        return self.octave
+        return self.pitch.octave
 
 
     @octave.setter
@@ -833,6 +912,7 @@ class TimeSignature(Event):
             The "denominator" of the key signature: a whole number power of 2.
     """
     __slots__ = ["upper", "lower"]
+    _TAG = 1 << 3
 
     def __init__(self,
                  parent: Optional["EventGroup"] = None,
@@ -862,7 +942,7 @@ class TimeSignature(Event):
         TimeSignature
             The TimeSignature instance itself.
         """
-        print(" " * indent, self, sep="")
+        sys.stdout.write(f"{' ' * indent}{self}\n")
         return self
 
 
@@ -893,6 +973,7 @@ class Clef(Event):
             "percussion", "treble8vb" (Other clefs may be added later.)
     """
     __slots__ = ["clef"]
+    _TAG = 1 << 4
 
     def __init__(self,
                  parent: Optional["EventGroup"] = None,
@@ -923,7 +1004,7 @@ class Clef(Event):
         Clef
             The Clef instance itself.
         """
-        print(" " * indent, self, sep="")
+        sys.stdout.write(f"{' ' * indent}{self}\n")
         return self
 
 
@@ -956,6 +1037,7 @@ class KeySignature(Event):
             An integer representing the number of sharps and flats.
     """
     __slots__ = ["key_sig"]
+    _TAG = 1 << 5
 
     def __init__(self, parent: Optional["EventGroup"] = None,
                  onset: float = 0.0, key_sig: int = 0):
@@ -984,11 +1066,23 @@ class KeySignature(Event):
         KeySignature
             The KeySignature instance itself.
         """
-        print(" " * indent, self, sep="")
+        sys.stdout.write(f"{' ' * indent}{self}\n")
         return self
 
 
 
+@dataclass
+class NoteArrays:
+    """The onsets, durations, and key numbers of a list of Notes as
+    parallel numpy arrays. See EventGroup.note_arrays().
+    """
+
+    onset: np.ndarray
+    duration: np.ndarray
+    key_num: np.ndarray
+
+
+
 class EventGroup(Event):
     """An EventGroup is a collection of Event objects. This is an abstract
     class. Use one of the subclasses: Score, Part, Staff, Measure or Chord.
@@ -1057,6 +1151,7 @@ class EventGroup(Event):
             Elements contained within this collection.
     """
     __slots__ = ["content"]
+    _TAG = 1 << 6
 
     def __init__(self, parent: Optional["EventGroup"],
                  onset: float, duration: Optional[float],
@@ -1209,11 +1304,40 @@ class EventGroup(Event):
         # returned since it is found first, and the content is not
         # searched. This makes it efficient, e.g., to search for
         # Parts in a Score without enumerating all Notes within.
-        for elem in self.content:
-            if isinstance(elem, elem_type):
-                yield elem
-            elif isinstance(elem, EventGroup):
-                yield from elem.find_all(elem_type)
+        mask = _TAG_MASKS.get(elem_type)
+        if mask is None:  # a class defined outside this module
+            for elem in self.content:
+                if isinstance(elem, elem_type):
+                    yield elem
+                elif isinstance(elem, EventGroup):
+                    yield from elem.find_all(elem_type)
+        else:
+            yield from self._find_tagged(mask)
+
+
+    def _find_tagged(self, mask: int) -> Generator[Event, None, None]:
+        """Implements find_all() using class tags rather than isinstance:
+        an element matches if its _TAG bit is in mask (see _TAG_MASKS).
+        The depth-first search keeps an explicit stack of content
+        iterators rather than nesting a generator per EventGroup, so
+        each element is yielded directly instead of passing up through
+        every enclosing level.
+        """
+        stack = []  # iterators over the content of enclosing groups
+        elems = iter(self.content)
+        while True:
+            for elem in elems:
+                tag = elem._TAG
+                if tag & mask:
+                    yield elem
+                elif tag & _GROUP_MASK:  # descend into elem's content
+                    stack.append(elems)
+                    elems = iter(elem.content)
+                    break
+            else:  # content is exhausted, so resume the enclosing group
+                if not stack:
+                    return
+                elems = stack.pop()
 
 
     def has_instanceof(self, the_class: Type[Event]) -> bool:
@@ -1230,9 +1354,25 @@ class EventGroup(Event):
         bool
             True iff the EventGroup contains an instance of the_class.
         """
-        instances = self.find_all(the_class)
-        # if there are no instances (of the_class), next will return "empty":
-        return next(instances, "empty") != "empty"
+        mask = _TAG_MASKS.get(the_class)
+        if mask is None:  # a class defined outside this module
+            instances = self.find_all(the_class)
+            # if there are no instances (of the_class), next will return "empty":
+            return next(instances, "empty") != "empty"
+        return self._has_tagged(mask)
+
+
+    def _has_tagged(self, mask: int) -> bool:
+        """Implements has_instanceof() with a plain recursive search that
+        stops at the first element whose _TAG bit is in mask.
+        """
+        for elem in self.content:
+            tag = elem._TAG
+            if tag & mask:
+                return True
+            if tag & _GROUP_MASK and elem._has_tagged(mask):
+                return True
+        return False
 
 
     def has_rests(self) -> bool:
@@ -1268,9 +1408,12 @@ class EventGroup(Event):
         bool
             True iff the EventGroup contains any tied notes.
         """
-        notes = self.find_all(Note)
-        for note in notes:
-            if note.tie:
+        for elem in self.content:
+            tag = elem._TAG
+            if tag & Note._TAG:
+                if elem.tie:
+                    return True
+            elif tag & _GROUP_MASK and elem.has_ties():
                 return True
         return False
 
@@ -1324,17 +1467,13 @@ class EventGroup(Event):
         """
         assert not event.parent
         assert event.onset != None  # must be a number
-        atend = self.last()
-        if atend and event.onset < atend.onset:
-            # search in reverse from end
-            i = len(self.content) - 2
-            while i >= 0 and self.content[i].onset > event.onset:
-                i -= 1
-            # now i is either -1 or content[i] <= event.onset, so
-            # insert event at content[i+1]
-            self.content.insert(i + 1, event)
+        content = self.content
+        if content and event.onset < content[-1].onset:
+            # binary search for the first element with a greater onset
+            i = bisect_right(content, event.onset, key=_event_onset)
+            content.insert(i, event)
         else:  # simply append at the end of content:
-            self.content.append(event)
+            content.append(event)
         event.parent = self
         return self
 
@@ -1366,11 +1505,50 @@ class EventGroup(Event):
             A list of all instances of the specified type found
             within the EventGroup.
         """
-        return list(self.find_all(elem_type))
+        mask = _TAG_MASKS.get(elem_type)
+        if mask is None:  # a class defined outside this module
+            return list(self.find_all(elem_type))
+        return self._collect_tagged(mask, [])
+
+
+    def _collect_tagged(self, mask: int, out: list[Event]) -> list[Event]:
+        """Implements list_all() like _find_tagged() but without
+        generators: matching elements are appended to out, in the same
+        depth-first order, and out is returned.
+        """
+        for elem in self.content:
+            tag = elem._TAG
+            if tag & mask:
+                out.append(elem)
+            elif tag & _GROUP_MASK:
+                elem._collect_tagged(mask, out)
+        return out
+
+
+    def note_arrays(self) -> NoteArrays:
+        """Collect the onsets, durations, and key numbers of all Notes
+        within the EventGroup, in the order given by list_all(Note), into
+        numpy arrays. Analyses can then compute on whole arrays rather
+        than on one Note at a time.
+
+        Returns
+        -------
+        NoteArrays
+            The onsets, durations, and key numbers as parallel arrays.
+        """
+        notes = self.list_all(Note)
+        n = len(notes)
+        # np.fromiter over attrgetter maps fills each array without
+        # running Python bytecode per note (Note has no onset property
+        # override, so we read the _onset slot directly)
+        return NoteArrays(
+            np.fromiter(map(_note_onset, notes), np.float64, n),
+            np.fromiter(map(_note_duration, notes), np.float64, n),
+            np.fromiter(map(_note_key_num, notes), np.float64, n))
 
 
     def merge_tied_notes(self, parent: Optional["EventGroup"] = None,
-                         ignore: list[Note] = []) -> "EventGroup":
+                         ignore: Optional[set[Note]] = None) -> "EventGroup":
         """Create a new EventGroup with tied note sequences replaced by
         equivalent notes in each staff. Insert the new EventGroup into parent.
         Notes identified as being tied to are passed in ignore.
@@ -1378,34 +1556,37 @@ class EventGroup(Event):
         # Algorithm: Find all notes, removing tied notes and updating
         # duration when ties are found. These tied notes are added to
         # ignore so they can be skipped when they are encountered.
-
+        # ignore is a set (Notes hash by identity), so each test and
+        # update is O(1) however many ties are pending.
+        if ignore is None:
+            ignore = set()
         group = self.emptycopy(parent)
         for event in self.content:
             if isinstance(event, Note):
                 if event in ignore:  # do not copy tied notes into group;
                     if event.tie:
-                        ignore.append(event.tie)  # add tied note to ignore
+                        ignore.add(event.tie)  # add tied note to ignore
                     # We will not see this note again, so
-                    # we can also remove it from ignore. Removal is expensive
-                    # but it could be worse for ignore to grow large when there
-                    # are many ties since we have to search it entirely once
-                    # per note. An alternate representation might be a set to
-                    # make searching fast.
+                    # we can also remove it from ignore.
                     ignore.remove(event)
                 else:
+                    # A Note contains no other Events, so rather than a deep
+                    # copy, a shallow copy suffices (sharing the immutable
+                    # Pitch) once we detach it from parent and tie and
+                    # give it its own info dict.
+                    event_copy = copy.copy(event)
+                    event_copy.parent = None
+                    event_copy.tie = None
+                    if event_copy.info:
+                        event_copy.info = copy.deepcopy(event_copy.info)
                     if event.tie:
-                        tied_note = event.tie  # save the tied-to note
-                        event.tie = None  # block the copy
-                        ignore.append(tied_note)
-                        event_copy = event.copy(group)  # copy note into group
-                        event.tie = tied_note  # restore original event
+                        ignore.add(event.tie)  # add tied note to ignore
                         # this is subtle: event.tied_duration (a property) will sum
                         # up durations of all the tied notes. Since event_copy
                         # is not tied, the sum of durations is stored on that
                         # one event_copy:
                         event_copy.duration = event.tied_duration
-                    else:
-                        event.copy(group)  # put the untied note into group
+                    group.insert(event_copy)  # put the note into group
             elif isinstance(event, EventGroup):
                 event.merge_tied_notes(group, ignore)
             else:
@@ -1524,7 +1705,7 @@ class EventGroup(Event):
         EventGroup
             The EventGroup instance itself.
         """
-        print(" " * indent, self, sep="")
+        sys.stdout.write(f"{' ' * indent}{self}\n")
         for elem in self.content:
             elem.show(indent + 4)
         return self
@@ -1575,6 +1756,7 @@ class Sequence(EventGroup):
             Elements contained within this collection.
     """
     __slots__ = []
+    _TAG = 1 << 7
 
     def __init__(self, parent: Optional[EventGroup],
                  onset: Optional[float] = None, duration: Optional[float] = None,
@@ -1589,17 +1771,16 @@ class Sequence(EventGroup):
         """return the offset (end) time of the last element,
         or the onset (start) time if the Sequence is empty
         """
-        if len(self.content) == 0:
-            return self.onset
-        else:
-            return self.last.offset
+        content = self.content
+        return content[-1].offset if content else self.onset
 
 
     def pack(self, onset: float = 0.0) -> float:
         """Adjust the content to be sequential, begining with the
         parameter onset (defaults to 0), and each other object at
         an onset equal to the offset of the previous element. The
-        duration of self is set to the offset of the last element.
+        duration of self is set so that self ends at the offset of
+        the last element.
         This method essentially arranges the content to eliminate
         gaps. pack() works recursively on elements that are
         EventGroups.
@@ -1616,11 +1797,12 @@ class Sequence(EventGroup):
         """
         self.onset = onset
         for elem in self.content:
-            elem.onset = onset
-            if isinstance(elem, EventGroup):
-                elem.duration = elem.pack()
+            if elem._TAG & _GROUP_MASK:
+                elem.pack(onset)  # sets elem onset and duration
+            else:
+                elem.onset = onset
             onset += elem.duration
-        self.duration = onset
+        self.duration = onset - self.onset
         return self.duration
 
 
@@ -1661,6 +1843,7 @@ class Concurrence(EventGroup):
         content : list[Event]
             Elements contained within this collection.
     """
+    _TAG = 1 << 8
 
     def __init__(self, parent: Optional["EventGroup"] = None,
                  onset: Optional[float] = None,
@@ -1707,13 +1890,16 @@ class Concurrence(EventGroup):
             duration of self
         """
         self.onset = onset
-        self.duration = 0
+        duration = 0
         for elem in self.content:
-            elem.onset = onset
-            if isinstance(elem, EventGroup):
-                elem.duration = elem.pack(onset)
-            self.duration = max(self.duration, elem.duration)
-        return self.duration
+            if elem._TAG & _GROUP_MASK:
+                elem.pack(onset)  # sets elem onset and duration
+            else:
+                elem.onset = onset
+            if elem.duration > duration:
+                duration = elem.duration
+        self.duration = duration
+        return duration
 
 
 class Chord(Concurrence):
@@ -1771,6 +1957,7 @@ class Chord(Concurrence):
             Elements contained within this collection.
     """
     __slots__ = []
+    _TAG = 1 << 9
 
     def __init__(self, *args: Event,
                  parent: Optional[EventGroup] = None,
@@ -1784,10 +1971,12 @@ class Chord(Concurrence):
     def is_measured(self):
         """Test if Chord conforms to strict hierarchy of Chord-Note
         """
+        excluded = (Score._TAG | Part._TAG | Staff._TAG | Measure._TAG |
+                    Rest._TAG | Chord._TAG)
         for note in self.content:
             # Chord can (in theory) contain many object types, so we can
             # only rule out things that are outside of the strict hierarchy:
-            if isinstance(note, (Score, Part, Staff, Measure, Rest, Chord)):
+            if note._TAG & excluded:
                 return False
         return True
 
@@ -1840,6 +2029,7 @@ class Measure(Sequence):
             A string representing the measure number if any.
     """
     __slots__ = ["number"]
+    _TAG = 1 << 10
 
     def __init__(self, *args: Event, parent: Optional[EventGroup] = None,
                  onset: float = None, duration: float = 4,
@@ -1865,12 +2055,14 @@ class Measure(Sequence):
         bool
             True if the Measure conforms to normal hierarchy.
         """
+        excluded = Score._TAG | Part._TAG | Staff._TAG | Measure._TAG
         for item in self.content:
             # Measure can (in theory) contain many object types, so we can
             # only rule out things that are outside of the strict hierarchy:
-            if isinstance(item, (Score, Part, Staff, Measure)):
+            tag = item._TAG
+            if tag & excluded:
                 return False
-            if isinstance(item, Chord) and not item.is_measured():
+            if tag & Chord._TAG and not item.is_measured():
                 return False
         return True
 
@@ -1922,6 +2114,7 @@ class Score(Concurrence):
     'composer', etc.
     """
     __slots__ = ["time_map"]
+    _TAG = 1 << 11
 
     def __init__(self, *args: Event,
                  onset: Optional[float] = 0,
@@ -2138,12 +2331,12 @@ class Score(Concurrence):
         # modifying the source Score (self).
         content = []  # collect selected Parts/Staffs here
         score = self.emptycopy()
+        # decide how to match part and staff once, not for every Part/Staff
+        part_selected = _selector(part, match_str=True)
+        staff_selected = _selector(staff, match_str=False)
         parts = self.find_all(Part)
         for i, p in enumerate(parts):
-            if (part is None
-                or (isinstance(part, int) and part == p.number)
-                or (isinstance(part, str) and part == p.instrument)
-                or (isinstance(part, list) and part[0] == i)):
+            if part_selected(i, p):
                 # merging tied notes takes place at the Part level because
                 # notes can be tied across Staffs.
                 if has_ties:
@@ -2155,10 +2348,8 @@ class Score(Concurrence):
                     content.append(p)
                 else:  # must find Notes in selected Staffs
                     staffs = p.find_all(Staff)
-                    for i, s in enumerate(staffs):
-                        if (staff is None
-                            or (isinstance(staff, int) and staff == s.number)
-                            or (isinstance(staff, list) and staff[0] == i)):
+                    for j, s in enumerate(staffs):
+                        if staff_selected(j, s):
                             content.append(s)
         # now content is a list of Parts or Staffs to merge
         notes = []
@@ -2177,7 +2368,7 @@ class Score(Concurrence):
         # notes can be modified, so reuse them in the new_part:
         for note in notes:
             note.parent = new_part
-        notes.sort(key=lambda x: (x.onset, x.pitch))
+        notes = _sort_notes(notes)
         new_part.content = notes
         # remove all the parts that we merged, leaving only new_part
         score.content = [new_part]
@@ -2205,10 +2396,13 @@ class Score(Concurrence):
             # first, see if all parts have the same instrument. If so, we
             # will set instrument in the collapsed part. Otherwise, the
             # collapsed part will not have an instrument name.
+            # At the same time, find the max offset of all Parts.
             instrument = None
             instr_state = None
+            offset = 0
             for part in score.content:
                 if isinstance(part, Part):
+                    offset = max(offset, part.offset)
                     if instr_state is None:  # capture first instrument name
                         instrument = part.instrument
                         instr_state = "set"
@@ -2224,13 +2418,12 @@ class Score(Concurrence):
             score.content = [new_part]  # remove all other parts and events
             for note in notes:
                 note.parent = new_part
-            # notes with equal onset times are sorted in pitch from high to low
-            notes.sort(key=lambda x: (x.onset, x.pitch))
+            # notes with equal onset times are sorted in pitch from low to high
+            notes = _sort_notes(notes)
 
             new_part.content = notes  # content will have only Notes
 
             # set the Part duration so it ends at the max offset of all Parts:
-            offset = max((part.offset for part in self.find_all(Part)), default=0)
             new_part.duration = offset - score.onset
 
         else:  # flatten each part separately
@@ -2314,12 +2507,15 @@ class Score(Concurrence):
         bool
             True if the Score is measured, False otherwise.
         """
+        excluded = (Score._TAG | Staff._TAG | Measure._TAG | Note._TAG |
+                    Rest._TAG | Chord._TAG)
         for part in self.content:
             # only Parts are expected, but things outside of the hierarchy
             # are allowed, so we only rule out violations of the hierarchy:
-            if isinstance(part, (Score, Staff, Measure, Note, Rest, Chord)):
+            tag = part._TAG
+            if tag & excluded:
                 return False
-            if isinstance(part, Part) and not part.is_measured():
+            if tag & Part._TAG and not part.is_measured():
                 return False
         return True
 
@@ -2339,14 +2535,17 @@ class Score(Concurrence):
         # flat scores. If the Part has a Staff, the Staffs are the
         # containers we want. If the Part has a Note, the Part itself is
         # the container. Other event classes can exist and are ignored.
+        # Each Part's content is scanned once, collecting Staffs as we go.
         for part in self.find_all(Part):
+            staffs = []
             for event in part.content:
-                if isinstance(event, Staff):
-                    containers += part.list_all(Staff)
-                    break
-                elif isinstance(event, Note):
+                tag = event._TAG
+                if tag & Staff._TAG:
+                    staffs.append(event)
+                elif tag & Note._TAG and not staffs:
                     containers.append(part)
                     break
+            containers += staffs
             # if part was empty, it is not added to containers
         return containers
 
@@ -2397,7 +2596,7 @@ class Score(Concurrence):
             The Score instance itself.
         """
 
-        print(" " * indent, self, sep="")
+        sys.stdout.write(f"{' ' * indent}{self}\n")
         self.time_map.show(indent + 4)
         for elem in self.content:
             elem.show(indent + 4)
@@ -2468,6 +2667,7 @@ class Part(EventGroup):
             A string representing the instrument name (if any).
     """
     __slots__ = ["number", "instrument"]
+    _TAG = 1 << 12
 
     def __init__(self, *args: Event,
                  parent: Optional[Score] = None,
@@ -2499,12 +2699,15 @@ class Part(EventGroup):
         """Test if Part is measured. Conforms to strict hierarchy of:
         Part-Staff-Measure-(Note or Rest or Chord) and Chord-Note.
         """
+        excluded = (Score._TAG | Part._TAG | Measure._TAG | Note._TAG |
+                    Rest._TAG | Chord._TAG)
         for staff in self.content:
             # only Staffs are expected, but things outside of the hierarchy
             # are allowed, so we only rule out violations of the hierarchy:
-            if isinstance(staff, (Score, Part, Measure, Note, Rest, Chord)):
+            tag = staff._TAG
+            if tag & excluded:
                 return False
-            if isinstance(staff, staff) and not staff.is_measured():
+            if tag & Staff._TAG and not staff.is_measured():
                 return False
         return True
 
@@ -2556,7 +2759,7 @@ class Part(EventGroup):
         notes = part.list_all(Note)  # need list so we can sort
         for note in notes:
             note.parent = part
-        notes.sort(key=lambda x: (x.onset, x.pitch))
+        notes = _sort_notes(notes)
         part.content = notes
         return part
 
@@ -2655,6 +2858,7 @@ class Staff(Sequence):
             where 1 is the top staff of the part, 2 is the 2nd, etc.
     """
     __slots__ = ["number"]
+    _TAG = 1 << 13
 
     def __init__(self, *args: Event,
                  parent: Optional[EventGroup] = None,
@@ -2677,13 +2881,16 @@ class Staff(Sequence):
         """Test if Staff is measured. Conforms to strict hierarchy of:
         Staff-Measure-(Note or Rest or Chord) and Chord-Note)
         """
+        excluded = (Score._TAG | Part._TAG | Staff._TAG | Note._TAG |
+                    Rest._TAG | Chord._TAG)
         for measure in self.content:
             # Staff can (in theory) contain many objects such as key signature
             # or time signature. We only rule out types that are
             # outside-of-hierarchy:
-            if isinstance(measure, (Score, Part, Staff, Note, Rest, Chord)):
+            tag = measure._TAG
+            if tag & excluded:
                 return False
-            if isinstance(measure, Measure) and not measure.is_measured():
+            if tag & Measure._TAG and not measure.is_measured():
                 return False
         return True
 
@@ -2717,3 +2924,20 @@ class Staff(Sequence):
                 new_content.append(measure)
         self.content = new_content
         return self
+
+
+
+# Class tags used by EventGroup.find_all(): each class above has a
+# distinct _TAG bit, and _TAG_MASKS maps each class to the union of the
+# bits of the class and all of its subclasses, so that `elem._TAG & mask`
+# is equivalent to `isinstance(elem, cls)`. Subclasses defined elsewhere
+# inherit the _TAG of their nearest base class here.
+_TAG_MASKS = {}
+for _cls in (Event, Rest, Note, TimeSignature, Clef, KeySignature,
+             EventGroup, Sequence, Concurrence, Chord, Measure, Score,
+             Part, Staff):  # base classes are listed before subclasses
+    _TAG_MASKS[_cls] = _cls._TAG
+    for _base in _cls.__mro__[1:]:
+        if _base in _TAG_MASKS:
+            _TAG_MASKS[_base] |= _cls._TAG
+_GROUP_MASK = _TAG_MASKS[EventGroup]
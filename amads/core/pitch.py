@@ -3,7 +3,6 @@
 # flake8: noqa E129,E303
 
 
-import functools
 from dataclasses import dataclass
 from math import floor
 from numbers import Number
@@ -13,8 +12,22 @@ from amads.core.vectors_sets import multiset_to_vector, weighted_to_indicator
 
 LETTER_TO_NUMBER = {"C": 0, "D": 2, "E": 4, "F": 5, "G": 7, "A": 9, "B": 11}
 
+# names of the pitch classes 0-11, spelled with sharps
+PITCH_CLASS_NAMES = ("C", "C#", "D", "D#", "E", "F", "F#", "G", "G#", "A", "A#", "B")
+
+# alteration adjustment indexed by the pitch class of `key_num - alt`,
+# giving the default spellings C#, Eb, F#, Ab, and Bb
+_ALT_FIX = (0, 1, 0, -1, 0, 0, 1, 0, -1, 0, -1, 0)
+
+# Sets of pitch classes as bit masks: pitch class pc is in the set
+# if (mask >> pc) & 1.
+_DIATONIC_MASK = 0b101010110101  # C, D, E, F, G, A, B
+_WHOLE_STEP_UP_MASK = 0b001010100101  # C, D, F, G, A
+_WHOLE_STEP_DOWN_MASK = 0b101010010100  # D, E, G, A, B
+_SHARP_ENHARMONIC_MASK = 0b000000100001  # C, F (B#, E#)
+_FLAT_ENHARMONIC_MASK = 0b100000010000  # E, B (Fb, Cb)
+
 
-@functools.total_ordering
 class Pitch:
     """A Pitch represents a symbolic musical pitch. It has two parts:
     The `key_num` is a number that corresponds to the MIDI convention
@@ -114,12 +127,11 @@ class Pitch:
             diff = unaltered - round(unaltered)
             self.alt -= diff
             unaltered = round(self.key_num - self.alt)
-        # make sure pitch class of unaltered is in {C D E F G A B}
-        pc = unaltered % 12
-        if pc in [6, 1]:  # F#->F, C#->C
-            self.alt += 1
-        elif pc in [10, 3, 8]:  # Bb->B, Eb->E, Ab->A
-            self.alt -= 1
+        # make sure pitch class of unaltered is in {C D E F G A B}:
+        # F#->F, C#->C (alt += 1); Bb->B, Eb->E, Ab->A (alt -= 1)
+        fix = _ALT_FIX[int(unaltered) % 12]
+        if fix:
+            self.alt += fix
         # now `(key_num + alt) % 12` is in {C D E F G A B}
 
 
@@ -131,6 +143,12 @@ class Pitch:
         elif isinstance(pitch, Pitch):
             self.key_num = pitch.key_num
             self.alt = pitch.alt
+        elif type(pitch) is int and alt is None:  # the common case, e.g. 60
+            self.key_num = pitch
+            self.alt = 0
+            fix = _ALT_FIX[pitch % 12]  # inline _fix_alteration()
+            if fix:
+                self.alt = fix
         else:
             # this will raise a ValueError if pitch is not some kind of number:
             pitch = float(pitch)  # converts numpy.int64, nympy.floating, etc.
@@ -172,7 +190,9 @@ class Pitch:
         bool
             True if the `key_num` and `alt` values are equal, False otherwise.
         """
-        return self.as_tuple() == other.as_tuple()
+        if not isinstance(other, Pitch):
+            return NotImplemented
+        return self.key_num == other.key_num and self.alt == other.alt
 
 
     def __hash__(self) -> int:
@@ -183,7 +203,10 @@ class Pitch:
         int
             A hash value representing the Pitch instance.
         """
-        return hash(self.as_tuple())
+        # Pack key_num and alt into one number rather than allocating a
+        # tuple. Python hashes equal numbers (int or float) equally, so
+        # this is consistent with __eq__ (|alt| is always far below 2**16).
+        return hash(self.key_num * 65536 + self.alt)
 
 
     def __lt__(self, other) -> bool:
@@ -202,9 +225,73 @@ class Pitch:
         bool
             True if this Pitch instance is less than the other, False otherwise.
         """
+        if not isinstance(other, Pitch):
+            return NotImplemented
         return (self.key_num, -self.alt) < (other.key_num, -other.alt)
 
 
+    # The other orderings compare the same key directly rather than being
+    # derived from __lt__ and __eq__ (as functools.total_ordering would),
+    # so each comparison is a single tuple comparison.
+    def __le__(self, other) -> bool:
+        """Check if this Pitch instance is less than or equal to another Pitch
+        instance, ordering pitches as in `__lt__`.
+
+        Parameters
+        ----------
+        other : Pitch
+            The other Pitch instance to compare with.
+
+        Returns
+        -------
+        bool
+            True if this Pitch instance is less than or equal to the other,
+            False otherwise.
+        """
+        if not isinstance(other, Pitch):
+            return NotImplemented
+        return (self.key_num, -self.alt) <= (other.key_num, -other.alt)
+
+
+    def __gt__(self, other) -> bool:
+        """Check if this Pitch instance is greater than another Pitch
+        instance, ordering pitches as in `__lt__`.
+
+        Parameters
+        ----------
+        other : Pitch
+            The other Pitch instance to compare with.
+
+        Returns
+        -------
+        bool
+            True if this Pitch instance is greater than the other, False otherwise.
+        """
+        if not isinstance(other, Pitch):
+            return NotImplemented
+        return (self.key_num, -self.alt) > (other.key_num, -other.alt)
+
+
+    def __ge__(self, other) -> bool:
+        """Check if this Pitch instance is greater than or equal to another Pitch
+        instance, ordering pitches as in `__lt__`.
+
+        Parameters
+        ----------
+        other : Pitch
+            The other Pitch instance to compare with.
+
+        Returns
+        -------
+        bool
+            True if this Pitch instance is greater than or equal to the other,
+            False otherwise.
+        """
+        if not isinstance(other, Pitch):
+            return NotImplemented
+        return (self.key_num, -self.alt) >= (other.key_num, -other.alt)
+
+
     @classmethod
     def from_name(cls, name: str,
                   octave: Optional[float],
@@ -368,7 +455,9 @@ class Pitch:
         """Returns the octave number based on `key_num - alt`, e.g.,
         C4 has octave 4 while B#3 has octave 3.
         """
-        unaltered = round(self.key_num - self.alt)
+        unaltered = self.key_num - self.alt
+        if type(unaltered) is not int:  # avoid round() in the common case
+            unaltered = round(unaltered)
         return (unaltered // 12) - 1
 
 
@@ -431,7 +520,10 @@ class Pitch:
         `floor(key_num)`, e.g., both C4 and B#3 have
         register 4.
         """
-        return floor(self.key_num) // 12 - 1
+        key_num = self.key_num
+        if type(key_num) is not int:  # avoid floor() in the common case
+            key_num = floor(key_num)
+        return key_num // 12 - 1
 
 
 #    @register.setter
@@ -483,18 +575,18 @@ class Pitch:
         alt = self.alt
         unaltered = round(self.key_num - alt)
         if alt < 0:
-            while alt < 0 or (unaltered % 12) not in [0, 2, 4, 5, 7, 9, 11]:
+            while alt < 0 or not (_DIATONIC_MASK >> (unaltered % 12)) & 1:
                 unaltered -= 1
                 alt += 1
         elif alt > 0:
-            while alt > 0 or (unaltered % 12) not in [0, 2, 4, 5, 7, 9, 11]:
+            while alt > 0 or not (_DIATONIC_MASK >> (unaltered % 12)) & 1:
                 unaltered += 1
                 alt -= 1
         else:  # alt == 0
             unaltered = unaltered % 12
-            if unaltered in [0, 5]:  # C->B#, F->E#
+            if (_SHARP_ENHARMONIC_MASK >> unaltered) & 1:  # C->B#, F->E#
                 alt = 1
-            elif unaltered in [11, 4]:  # B->Cb, E->Fb
+            elif (_FLAT_ENHARMONIC_MASK >> unaltered) & 1:  # B->Cb, E->Fb
                 alt = -1
             else:  # A->Bbb, D->Ebb, G->Abb
                 alt = -2
@@ -538,7 +630,7 @@ class Pitch:
         if self.alt in [None, 0]:
             return self
 
-        if self.pitch_class in [0, 2, 4, 5, 7, 9, 11]:  # C, D, E, F, G, A, B
+        if (_DIATONIC_MASK >> self.pitch_class) & 1:  # C, D, E, F, G, A, B
             return Pitch(self.key_num)
         elif sharp_or_flat == "sharp":  # unaltered in 1, 3, 6, 8, 10
             return Pitch(self.key_num, alt=1)
@@ -583,7 +675,7 @@ class Pitch:
         """
         alt = self.alt
         unaltered = round(self.key_num - alt) % 12
-        if unaltered in [0, 2, 4, 7, 9]:  # C->D, D->E, F->G, G->A, A->B
+        if (_WHOLE_STEP_UP_MASK >> unaltered) & 1:  # C, D, F, G, A
             alt -= 2
         else:  # E->F, B->C
             alt -= 1
@@ -612,7 +704,7 @@ class Pitch:
         """
         alt = self.alt
         unaltered = round(self.key_num - alt) % 12
-        if unaltered in [2, 4, 7, 9, 11]:  # D->C, E->D, G->F, A->G, B->A
+        if (_WHOLE_STEP_DOWN_MASK >> unaltered) & 1:  # D, E, G, A, B
             alt += 2
         else:  # F->E, C->B
             alt += 1
@@ -1,6 +1,8 @@
 # timemap.py -- map to convert between quarters and seconds
 #
 
+import numpy as np
+
 
 class MapBeat:
     """MapBeat is a (time, beat) pair in a piece-wise linear mapping."""
@@ -103,6 +105,30 @@ class TimeMap:
         beat_dif = mb1.beat - mb0.beat
         return mb0.time + (beat - mb0.beat) * time_dif / beat_dif
 
+    def beat_to_time_array(self, beats):
+        """convert an array of beat times to seconds; equivalent to
+        calling beat_to_time on each element, but computed with numpy
+        """
+        beats = np.asarray(beats, dtype=np.float64)
+        map_beats = np.array([mb.beat for mb in self.beats])
+        map_times = np.array([mb.time for mb in self.beats])
+        # seconds per beat from map entry i - 1 to map entry i, and,
+        # at index len(self.beats), beyond the last entry (see beat_to_time)
+        spb = np.empty(len(self.beats) + 1)
+        spb[0] = 0.0  # unused: index 0 is only found for beats <= 0
+        spb[1:-1] = np.diff(map_times) / np.diff(map_beats)
+        if self.last_tempo:
+            spb[-1] = 1.0 / self.last_tempo
+        elif len(self.beats) == 1:  # assume a tempo of 100
+            spb[-1] = 0.6
+        else:  # extrapolate from last two time map entries
+            spb[-1] = spb[-2]
+        i = np.searchsorted(map_beats, beats)  # same as locate_beat()
+        j = np.maximum(i, 1) - 1
+        times = map_times[j] + (beats - map_beats[j]) * spb[i]
+        # there is no negative time or tempo before 0
+        return np.where(beats <= 0, beats, times)
+
     def beat_to_tempo(self, beat):
         """what is the tempo in bpm at beat? If there is a tempo change
         here, use the tempo on the left (before the change)
@@ -1,7 +1,9 @@
+from functools import lru_cache
 from types import ModuleType
 from typing import Dict, List, Optional, Union
 
 import matplotlib.pyplot as plt
+import numpy as np
 from matplotlib.figure import Figure
 
 from amads.core.basics import Chord, Note
@@ -10,6 +12,28 @@ from amads.pitch import PitchCollection
 __author__ = "Peter Harrison"
 
 
+# _INTERVAL_PCS[root, interval] is the pitch class `interval` semitones
+# above `root`
+_INTERVAL_PCS = (np.arange(12)[:, None] + np.arange(12)) % 12
+
+
+@lru_cache(maxsize=4096)
+def _compute_strengths(
+    pc_set: frozenset[int], root_support_weights: tuple[tuple[int, float], ...]
+) -> tuple[float, ...]:
+    """Root support of every pitch class for a pitch-class set, given the
+    weights as (interval, weight) pairs. Cached, since many analyses
+    share the same chord and weights."""
+    present = np.zeros(12, dtype=bool)
+    present[list(pc_set)] = True
+    weights = np.zeros(12)
+    for interval, support_weight in root_support_weights:
+        weights[interval % 12] += support_weight
+    # row `root` selects the weights of the intervals whose pitch class
+    # is in the chord, summed in interval order for every root
+    return tuple((present[_INTERVAL_PCS] @ weights).tolist())
+
+
 class ParncuttRootAnalysis:
     """
     Parncutt's (1988) model for finding the root of a chord.
@@ -119,7 +143,11 @@ class ParncuttRootAnalysis:
         self.pitch_set, self.pc_set = self.load_chord(chord)
         self.root_support_weights = self.load_root_support_weights(root_support_weights)
         self.exponent = exponent
-        self.root_strengths = [self.get_root_strength(pc) for pc in range(12)]
+        self.root_strengths = list(
+            _compute_strengths(
+                frozenset(self.pc_set), tuple(self.root_support_weights.items())
+            )
+        )
         self.root = self.get_root()
         self.root_ambiguity = self.get_root_ambiguity()
 
@@ -158,11 +186,7 @@ class ParncuttRootAnalysis:
             return root_support_weights
 
     def get_root_strength(self, pc: int) -> float:
-        return sum(
-            support_weight
-            for interval, support_weight in self.root_support_weights.items()
-            if (pc + interval) % 12 in self.pc_set
-        )
+        return self.root_strengths[pc % 12]
 
     def get_root(self) -> int:
         return self.root_strengths.index(max(self.root_strengths))
@@ -5,8 +5,16 @@ Original Doc: https://citeseerx.ist.psu.edu/document?repid=rep1&type=pdf&doi=6e0
 
 import matplotlib.pyplot as plt
 from matplotlib import figure, patches
+from matplotlib.collections import PatchCollection
 
 from ..core.basics import Part, Score
+from ..core.pitch import PITCH_CLASS_NAMES
+
+# pitch class names for each choice of accidental in midi_num_to_name
+_NOTE_NAMES = {
+    "sharp": PITCH_CLASS_NAMES,
+    "flat": ("C", "Db", "D", "Eb", "E", "F", "Gb", "G", "Ab", "A", "Bb", "B"),
+}
 
 
 def midi_num_to_name(midi_num: int, accidental) -> str:
@@ -29,19 +37,10 @@ def midi_num_to_name(midi_num: int, accidental) -> str:
         ValueError: If there are invalid input argument.
     """
 
-    octave = str(int((midi_num / 12) - 1))
-
-    match accidental:
-        case "sharp":
-            base = ["C", "C#", "D", "D#", "E", "F", "F#", "G", "G#", "A", "A#", "B"][
-                midi_num % 12
-            ]
-        case "flat":
-            base = ["C", "Db", "D", "Eb", "E", "F", "Gb", "G", "Ab", "A", "Bb", "B"][
-                midi_num % 12
-            ]
-
-    return base + octave
+    names = _NOTE_NAMES.get(accidental)
+    if names is None:
+        raise ValueError("Invalid accidental type")
+    return names[midi_num % 12] + str(midi_num // 12 - 1)
 
 
 def pianoroll(
@@ -87,46 +86,34 @@ def pianoroll(
 
     fig, ax = plt.subplots()
 
-    min_note, max_note = 127.0, 0.0
-    max_time = 1  # plot at least 1 second or beat
     # remove ties and make a sorted list of all notes:
     score = score.flatten(collapse=True)
     # now score has one part that is all notes
-    for note in next(score.find_all(Part)).content:
-        onset_time = note.onset
-        offset_time = note.offset
-        pitch = note.key_num - 0.5  # to center note rectangle
-
-        # Conditionally converts beat to sec
-        if x_label == "sec":
-            onset_time = score.time_map.beat_to_time(onset_time)
-            offset_time = score.time_map.beat_to_time(offset_time)
-
-        # Stores min and max note for y_axis labeling
-        if pitch < min_note:
-            min_note = pitch
-        if pitch > max_note:
-            max_note = pitch
-
-        # Stores max note start time + note duration for x_axis limit
-        if offset_time > max_time:
-            max_time = offset_time
-
-        # Draws the note
-        print("draw note from", onset_time, "to", offset_time, "at", pitch)
-        rect = patches.Rectangle(
-            (onset_time, pitch),
-            offset_time - onset_time,
-            1,
-            edgecolor="black",
-            facecolor=color,
-        )
-        ax.add_patch(rect)
-
-    # Determines correct axis labels
-    if min_note == 127 and max_note == 0:  # "fake" better axes:
-        min_note = 59
-        max_note = 59
+    note_arrays = next(score.find_all(Part)).note_arrays()
+    onset_times = note_arrays.onset
+    offset_times = note_arrays.onset + note_arrays.duration
+    pitches = note_arrays.key_num - 0.5  # to center note rectangles
+
+    # Conditionally converts beat to sec
+    if x_label == "sec":
+        onset_times = score.time_map.beat_to_time_array(onset_times)
+        offset_times = score.time_map.beat_to_time_array(offset_times)
+
+    # Draws the notes
+    rects = [
+        patches.Rectangle((onset_time, pitch), offset_time - onset_time, 1)
+        for onset_time, offset_time, pitch in zip(onset_times, offset_times, pitches)
+    ]
+    ax.add_collection(PatchCollection(rects, edgecolor="black", facecolor=color))
+
+    # Determines correct axis labels and limits
+    if len(pitches) > 0:
+        min_note, max_note = pitches.min(), pitches.max()
+        # plot at least 1 second or beat
+        max_time = max(1, offset_times.max())
+    else:  # "fake" better axes:
+        min_note, max_note = 59, 59
+        max_time = 1
 
     midi_numbers = list(range(int(min_note), int(max_note + 2)))
 
@@ -146,7 +133,7 @@ def pianoroll(
     ax.set_yticklabels(notes)
 
     ax.set_xlim(0, max_time)
-    ax.set_ylim(min(midi_numbers), max(midi_numbers) + 1)
+    ax.set_ylim(midi_numbers[0], midi_numbers[-1] + 1)
 
     ax.grid(True)
 
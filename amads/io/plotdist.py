@@ -7,6 +7,8 @@ import matplotlib.pyplot as plt
 import numpy as np
 from matplotlib import figure
 
+from ..core.pitch import PITCH_CLASS_NAMES
+
 
 def plotdist(dist, *, ivdir=False) -> figure.Figure:
     """Creates a graph of note, interval, or duration distributions/transitions.
@@ -71,9 +73,7 @@ def pitch_class(dist_array: np.ndarray) -> figure.Figure:
     fig, ax = plt.subplots()
 
     # Used code from pcdist1_test.py
-    pitch_classes = ["C", "C#", "D", "D#", "E", "F", "F#", "G", "G#", "A", "A#", "B"]
-
-    ax.bar(pitch_classes, dist_array, color="skyblue")
+    ax.bar(PITCH_CLASS_NAMES, dist_array, color="skyblue")
     ax.set_xlabel("Pitch Class")
     ax.set_ylabel("Probability")
     ax.set_title("Pitch-Class Distribution")
@@ -242,9 +242,8 @@ def pitch_class_transition(dist_array: np.ndarray) -> figure.Figure:
     ax.set_ylabel("Pitch Class (from)")
     ax.set_title("2nd Order Pitch-Class Distribution")
 
-    pitch_classes = ["C", "C#", "D", "D#", "E", "F", "F#", "G", "G#", "A", "A#", "B"]
-    ax.set_xticks(range(12), pitch_classes)
-    ax.set_yticks(range(12), pitch_classes)
+    ax.set_xticks(range(12), PITCH_CLASS_NAMES)
+    ax.set_yticks(range(12), PITCH_CLASS_NAMES)
 
     return fig
 
@@ -120,7 +120,7 @@ class PolynomialContour:
             A tuple containing (onset_times, pitch_values)
         """
         flattened_score = score.flatten(collapse=True)
-        notes = list(flattened_score.find_all(Note))
+        notes = flattened_score.list_all(Note)
         return [note.onset for note in notes], [note.key_num for note in notes]
 
     def center_onset_times(self, onsets: list[float]) -> list[float]:
@@ -34,7 +34,7 @@ def fantastic_pitch_features(score: Score) -> Dict:
             - pitch_entropy: A variant of the Shannon entropy of the pitches in the melody.
     """
     flattened_score = score.flatten(collapse=True)
-    notes = list(flattened_score.find_all(Note))
+    notes = flattened_score.list_all(Note)
 
     pitches = [note.pitch.key_num for note in notes]
 
@@ -79,7 +79,7 @@ def fantastic_pitch_interval_features(score: Score) -> Dict:
             - interval_entropy: A variant of the Shannon entropy of the absolute pitch intervals in the melody.
     """
     flattened_score = score.flatten(collapse=True)
-    notes = list(flattened_score.find_all(Note))
+    notes = flattened_score.list_all(Note)
 
     pitches = [note.pitch.key_num for note in notes]
     # Fantastic defines intervals by looking forwards
@@ -174,7 +174,7 @@ def fantastic_step_contour_features(score: Score) -> Dict:
             - local_variation: The local variation of the step contour.
     """
     flattened_score = score.flatten(collapse=True)
-    notes = list(flattened_score.find_all(Note))
+    notes = flattened_score.list_all(Note)
 
     # Extract pitches and times for contour calculation
     pitches = [note.pitch.key_num for note in notes]
@@ -209,7 +209,7 @@ def fantastic_interpolation_contour_features(score: Score) -> Dict:
             - class_label: The class label of the interpolation contour.
     """
     flattened_score = score.flatten(collapse=True)
-    notes = list(flattened_score.find_all(Note))
+    notes = flattened_score.list_all(Note)
 
     # Extract pitches and times for contour calculation
     pitches = [note.pitch.key_num for note in notes]
@@ -251,7 +251,7 @@ def fantastic_parsons_contour_features(
     """
 
     flattened_score = score.flatten(collapse=True)
-    notes = list(flattened_score.find_all(Note))
+    notes = flattened_score.list_all(Note)
 
     pitches = [note.pitch.key_num for note in notes]
     pc = ParsonsContour(
@@ -309,7 +309,7 @@ def fantastic_huron_contour_features(score: Score) -> Dict:
             - contour_class: The class of the Huron contour.
     """
     flattened_score = score.flatten(collapse=True)
-    notes = list(flattened_score.find_all(Note))
+    notes = flattened_score.list_all(Note)
 
     pitches = [note.pitch.key_num for note in notes]
     times = [note.onset for note in notes]
@@ -28,7 +28,7 @@ def fantastic_segmenter(score: Score, phrase_gap: float, units: str) -> List[Sco
     if units == "quarters":
         # Extract notes from score
         flattened_score = score.flatten(collapse=True)
-        notes = list(flattened_score.find_all(Note))
+        notes = flattened_score.list_all(Note)
 
         # Create a dictionary to store IOI information
         ioi_data = {}
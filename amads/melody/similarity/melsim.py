@@ -283,8 +283,11 @@ def load_similarity_measure(method: str, transformation: str):
     if transformation not in valid_transformations:
         raise ValueError(f"Invalid transformation: {transformation}")
 
+    # one R variable per (method, transformation), so that every cached
+    # combination stays valid when the same method is loaded again with
+    # another transformation
     ro.r.assign(
-        f"{method}_sim",
+        f"{method}_{transformation}_sim",
         ro.r("sim_measure_factory$new")(
             name=method,
             full_name=method,
@@ -322,8 +325,7 @@ def r_get_similarity(
     # Load the similarity measure
     load_similarity_measure(method, transformation)
 
-    return float(
-        ro.r(f"{melody_1}$similarity")(ro.r(f"{melody_2}"), ro.r(f"{method}_sim")).rx2(
-            "sim"
-        )[0]
+    similarity = ro.r(f"{melody_1}$similarity")(
+        ro.r(f"{melody_2}"), ro.r(f"{method}_{transformation}_sim")
     )
+    return float(similarity.rx2("sim")[0])
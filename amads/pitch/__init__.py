@@ -4,6 +4,7 @@ The 'pitch' module contains functions and classes related to pitch.
 
 from __future__ import annotations
 
+from amads.core.pitch import PITCH_CLASS_NAMES
 from amads.core.vectors_sets import multiset_to_vector, weighted_to_indicator
 
 from .transformations import *
@@ -90,8 +91,7 @@ class Pitch:
         Converts a MIDI number to a pitch name
         Always default to no sharps/flat or single sharps.
         """
-        base_names = ("C", "C#", "D", "D#", "E", "F", "F#", "G", "G#", "A", "A#", "B")
-        base_name = base_names[midi % 12]
+        base_name = PITCH_CLASS_NAMES[midi % 12]
         octave = midi // 12 - 1
         return f"{base_name}{octave}", octave
 
@@ -2,10 +2,12 @@
 Provides the function `ismonophonic`
 """
 
-from ..core.basics import Note, Part, Score
+import numpy as np
 
+from ..core.basics import NoteArrays, Part, Score
 
-def _ismonophonic(notes: list[Note]):
+
+def _ismonophonic(notes: NoteArrays):
     """
     Returns if a list of notes is monophonic
 
@@ -14,23 +16,19 @@ def _ismonophonic(notes: list[Note]):
     `parts_are_monophonic`.
 
     Args:
-        note (list[Note]): The list of notes to analyze
+        notes (NoteArrays): The notes to analyze (see
+            EventGroup.note_arrays())
 
     Returns:
         bool: True if the list of notes is monophonic
     """
-    prev = None
-    notes = list(notes)
     # Sort the notes by start time
-    notes.sort(key=lambda note: note.onset)
-    # Check for overlaps
-    for note in notes:
-        if prev:
-            # 0.01 is to prevent precision errors when comparing floats
-            if note.onset - prev.offset < -0.01:
-                return False
-        prev = note
-    return True
+    order = np.argsort(notes.onset, kind="stable")
+    onsets = notes.onset[order]
+    offsets = onsets + notes.duration[order]
+    # Check for overlaps of each note with the previous one.
+    # 0.01 is to prevent precision errors when comparing floats
+    return bool(np.all(onsets[1:] - offsets[:-1] >= -0.01))
 
 
 def ismonophonic(score: Score):
@@ -45,7 +43,7 @@ def ismonophonic(score: Score):
     Returns:
         bool: True if the score is monophonic
     """
-    return _ismonophonic(score.find_all(Note))
+    return _ismonophonic(score.note_arrays())
 
 
 def parts_are_monophonic(score: Score):
@@ -53,6 +51,6 @@ def parts_are_monophonic(score: Score):
     Returns if all parts of a musical score are monophonic
     """
     for part in score.find_all(Part):
-        if not _ismonophonic(part.find_all(Note)):
+        if not _ismonophonic(part.note_arrays()):
             return False
     return True
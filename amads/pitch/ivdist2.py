@@ -101,7 +101,8 @@ def ivdist2(score: Score, weighted=True) -> list[list[float]]:
 
     id = [[0] * 25 for _ in range(25)]  # interval distribution matrix
 
-    score = score.merge_tied_notes()  # merges tied notes
+    if score.has_ties():  # otherwise, no need to copy the score
+        score = score.merge_tied_notes()  # merges tied notes
     notes = score.list_all(Note)
     update_id(id, notes, weighted)
 
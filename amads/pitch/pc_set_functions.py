@@ -15,6 +15,7 @@ but the functions are general
 and not really named algorithms in sense used elsewhere on this code base.
 """
 
+from functools import cache
 from typing import List, Tuple, Union
 
 from . import pc_sets
@@ -113,37 +114,48 @@ def pitches_to_forte_class(pitches: Union[List[int], Tuple[int]]):
     raise ValueError(f"{pitches} is not a valid entry.")
 
 
-def pitches_to_prime(pitches: Union[List[int], Tuple[int]]):
+def _pcs_to_mask(pitches) -> int:
     """
-    In: a list or tuple of pitches expressed as integers (0–11) for sets with 2-10 distinct pitches.
-    Out: the prime form.
+    In: a list or tuple of pitches (any integers).
+    Out: the distinct PCs as a 12-bit mask, with bit n set for PC n.
+    """
+    mask = 0
+    for p in pitches:
+        mask |= 1 << (p % 12)
+    return mask
 
-    The function first converts the pitches to their interval vector (easy, fast).
-    That vector unambiguously gives the prime form for cases except those with Z-related pairs.
-    This affects one pair of tetrachords (so 2 prime forms) and 15 pairs of hexachords (30 primes).
 
-    In those cases, the prime form is worked out by comparing the pitch list against the pair of
-    options in both inversions until a match is found.
+@cache
+def _prime_forms_by_mask() -> list:
+    """
+    Map each of the 4096 possible PC sets (as 12-bit masks) to its prime form
+    by expanding every prime form in `pc_sets` into all 24 of its
+    transpositions and inversions.
+    Sets with fewer than 2 or more than 10 PCs map to None.
+    Built on first use.
     """
+    primes = [None] * 4096
+    for data in pc_sets.set_classes:
+        for entry in data or ():
+            prime = entry[1]
+            for t in range(12):
+                primes[_pcs_to_mask(x + t for x in prime)] = prime
+                primes[_pcs_to_mask(t - x for x in prime)] = prime
+    return primes
 
-    pitches = distinct_PCs(pitches)
 
-    vector = pitches_to_interval_vector(pitches)
-    primes = []
-    data = set_classes_from_cardinality(len(set(pitches)))
+def pitches_to_prime(pitches: Union[List[int], Tuple[int]]):
+    """
+    In: a list or tuple of pitches expressed as integers (0–11) for sets with 2-10 distinct pitches.
+    Out: the prime form.
 
-    for x in data:
-        if x[2] == vector:
-            primes.append(x[1])
-
-    if len(primes) == 1:
-        return primes[0]
-    elif len(primes) > 1:
-        for prime in primes:  # each possible prime form
-            inverted = pitch_list_transformations.invert(prime)
-            for t in [prime, inverted]:
-                if transposition_equivalent(t, pitches):
-                    return prime
+    The pitches are reduced to a 12-bit mask of their distinct PCs,
+    which indexes a table (built once, on first use) mapping every Tn/TnI form of
+    every set class to its prime form as listed in `pc_sets`.
+    """
+    mask = _pcs_to_mask(pitches)
+    set_classes_from_cardinality(mask.bit_count())  # check the cardinality
+    return _prime_forms_by_mask()[mask]
 
 
 def transposition_equivalent(set1, set2):
@@ -4,7 +4,9 @@ Pitch class distribution analysis.
 Original doc: https://citeseerx.ist.psu.edu/document?repid=rep1&type=pdf&doi=6e06906ca1ba0bf0ac8f2cb1a929f3be95eeadfa#page=80.
 """
 
-from ..core.basics import Note, Score
+import numpy as np
+
+from ..core.basics import Score
 
 
 def pcdist1(score: Score, weighted: bool = True) -> list[float]:
@@ -26,17 +28,14 @@ def pcdist1(score: Score, weighted: bool = True) -> list[float]:
         class (C, C#, D, D#, E, F, F#, G, G#, A, A#, B). If the score is empty,
         returns a list with all elements set to zero.
     """
-    pcd = [0] * 12
-
-    if weighted:  # no need to merge ties due to weighting
-        for note in score.find_all(Note):
-            pc = note.pitch_class
-            pcd[pc] += note.duration
-    else:  # count tied notes as single notes
+    # no need to merge ties when weighting by durations, but otherwise
+    # count tied notes as single notes
+    if not weighted and score.has_ties():
         score = score.merge_tied_notes()
-        for note in score.find_all(Note):
-            pcd[pc] += 1
-    total = sum(pcd)
+    notes = score.note_arrays()
+    pcs = np.rint(notes.key_num).astype(np.int64) % 12
+    pcd = np.bincount(pcs, weights=notes.duration if weighted else None, minlength=12)
+    total = pcd.sum()
     if total > 0:
-        pcd = [i / total for i in pcd]
-    return pcd
+        pcd = pcd / total
+    return pcd.tolist()
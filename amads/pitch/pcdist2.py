@@ -4,33 +4,30 @@ This module provides the `pcdist2` function.
 Original doc: https://citeseerx.ist.psu.edu/document?repid=rep1&type=pdf&doi=6e06906ca1ba0bf0ac8f2cb1a929f3be95eeadfa#page=81.
 """
 
-from ..core.basics import Note, Score
+import numpy as np
 
+from ..core.basics import NoteArrays, Score
 
-def update_pcd(pcd: list[list[float]], notes: list[Note], weighted: bool):
+
+def update_pcd(pcd: np.ndarray, notes: NoteArrays, weighted: bool):
     """Updates the pitch-class distribution matrix based on the given notes.
 
     Serves as a helper function for `pcdist2`
 
     Args:
-        pcd (list[list[float]]): The pitch-class distribution matrix to be
-                                 updated.
-        notes (list[Note]): The list of notes to process.
+        pcd (np.ndarray): The 12x12 pitch-class distribution matrix to be
+                          updated.
+        notes (NoteArrays): The notes to process.
         weighted (bool, optional): If True, the pitch-class distribution is
                                    weighted by note durations.
     """
-    prev = None
-    for note in notes:
-        if prev:
-            pc_curr = note.pitch_class
-            pc_prev = prev.pitch_class
-
-            if weighted:
-                pcd[pc_prev][pc_curr] += prev.duration * note.duration
-            else:
-                pcd[pc_prev][pc_curr] += 1
-
-        prev = note
+    pcs = np.rint(notes.key_num).astype(np.int64) % 12
+    weights = None
+    if weighted:
+        weights = notes.duration[:-1] * notes.duration[1:]
+    # each pair (pc_prev, pc_curr) counts in pcd[pc_prev][pc_curr]
+    counts = np.bincount(pcs[:-1] * 12 + pcs[1:], weights=weights, minlength=144)
+    pcd += counts.reshape(12, 12)
 
 
 def pcdist2(score: Score, weighted=True) -> list[list[float]]:
@@ -49,15 +46,12 @@ def pcdist2(score: Score, weighted=True) -> list[list[float]]:
                            the function returns a list with all elements
                            set to zero.
     """
-    pcd = [[0] * 12 for _ in range(12)]
-
-    score = score.merge_tied_notes()
+    pcd = np.zeros((12, 12))
+    if score.has_ties():  # otherwise, no need to copy the score
+        score = score.merge_tied_notes()
     for container in score.note_containers():
-        notes = container.find_all(Note)
-        update_pcd(pcd, notes, weighted)
-
-    total = sum(sum(row) for row in pcd)
+        update_pcd(pcd, container.note_arrays(), weighted)
+    total = pcd.sum()
     if total > 0:
-        pcd = [[value / total for value in row] for row in pcd]
-
-    return pcd
+        pcd /= total
+    return pcd.tolist()
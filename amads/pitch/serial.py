@@ -8,11 +8,43 @@ that are specific to tone rows in serial music.
 
 """
 
+from operator import itemgetter
 from typing import List, Tuple, Union
 
 from .transformations import every_nth, transpose_to
 
 
+def _hexachord_rotations() -> tuple:
+    """
+    Index permutations for steps 1-5 of `rotate_hexachords`,
+    each rotating both hexachords of a 12-element row by that many steps.
+    """
+    rotations = []
+    for i in range(1, 6):
+        first = [*range(i, 6), *range(i)]
+        rotations.append(itemgetter(*first, *(x + 6 for x in first)))
+    return tuple(rotations)
+
+
+def _pair_swaps() -> tuple:
+    """
+    Index permutations for the 12 successive rows of `pair_swap_krenek`,
+    alternately swapping the pairs starting at positions 1 and 0.
+    """
+    indices = list(range(12))
+    swaps = []
+    for _ in range(6):
+        for start in (1, 0):
+            for x in range(start, 11, 2):
+                indices[x], indices[x + 1] = indices[x + 1], indices[x]
+            swaps.append(itemgetter(*indices))
+    return tuple(swaps)
+
+
+_HEXACHORD_ROTATIONS = _hexachord_rotations()
+_PAIR_SWAPS = _pair_swaps()
+
+
 def rotate_hexachords(
     row: Union[List, Tuple], transpose_iterations: bool = False
 ) -> list:
@@ -58,15 +90,16 @@ def rotate_hexachords(
     hexachord1note1 = row[0]
     hexachord2note1 = row[6]
 
-    for i in range(1, 6):
-        first_hexachord = row[i:6] + row[0:i]
-        second_hexachord = row[6 + i :] + row[6 : 6 + i]
+    for rotation in _HEXACHORD_ROTATIONS:
+        rotated = rotation(row)
 
         if transpose_iterations:
-            first_hexachord = transpose_to(first_hexachord, start=hexachord1note1)
-            second_hexachord = transpose_to(second_hexachord, start=hexachord2note1)
+            first_hexachord = transpose_to(rotated[:6], start=hexachord1note1)
+            second_hexachord = transpose_to(rotated[6:], start=hexachord2note1)
+            new_row = first_hexachord + second_hexachord
+        else:
+            new_row = list(rotated)
 
-        new_row = first_hexachord + second_hexachord
         rows.append(new_row)
 
     rows.append(row)  # completes the cycle
@@ -113,23 +146,9 @@ def pair_swap_krenek(row: Union[List, Tuple]) -> list:
 
     """
 
-    rows = [row]
-
-    for pair in range(6):
-
-        # First swap operation: starting at position 1 (2nd pitch)
-        row = [x for x in row]
-        for x in range(1, 11, 2):
-            row[x], row[x + 1] = row[x + 1], row[x]
-        rows.append(row)
-
-        # Second swap operation: starting at position 0 (1st pitch)
-        row = [x for x in row]
-        for x in range(0, 12, 2):
-            row[x], row[x + 1] = row[x + 1], row[x]
-        rows.append(row)
-
-    return rows
+    # Each row is a fixed permutation of the first: swaps starting at
+    # position 1 (2nd pitch) alternate with swaps starting at position 0.
+    return [row] + [list(swap(row)) for swap in _PAIR_SWAPS]
 
 
 def lumsdaine_cycle(
@@ -41,13 +41,9 @@ def transpose_by(pitches: Iterable, semitones: int, mod_12: bool = True) -> list
     [16, 17, 18, 19]
 
     """
-    result = []
-    for pitch in pitches:
-        transposed = pitch + semitones
-        if mod_12:
-            transposed %= 12
-        result.append(transposed)
-    return result
+    if mod_12:
+        return [(pitch + semitones) % 12 for pitch in pitches]
+    return [pitch + semitones for pitch in pitches]
 
 
 def transpose_to(pitches: Iterable, start: int = 0, mod_12: bool = True) -> list:
@@ -80,13 +76,9 @@ def transpose_to(pitches: Iterable, start: int = 0, mod_12: bool = True) -> list
 
     """
     difference = start - pitches[0]
-    result = []
-    for pitch in pitches:
-        transposed = pitch + difference
-        if mod_12:
-            transposed %= 12
-        result.append(transposed)
-    return result
+    if mod_12:
+        return [(pitch + difference) % 12 for pitch in pitches]
+    return [pitch + difference for pitch in pitches]
 
 
 def retrograde(pitches: Iterable) -> list:
@@ -143,15 +135,10 @@ def invert(
     [7, 6, 5]
 
     """
-    origin = pitches[0] if use_first_not_0 else 0
-    result = []
-    for pitch in pitches:
-        inverted = 2 * origin - pitch
-        if mod_12:
-            inverted %= 12
-        result.append(inverted)
-
-    return result
+    axis = 2 * pitches[0] if use_first_not_0 else 0
+    if mod_12:
+        return [(axis - pitch) % 12 for pitch in pitches]
+    return [axis - pitch for pitch in pitches]
 
 
 def pitches_to_intervals(
@@ -183,16 +170,11 @@ def pitches_to_intervals(
     [2, 3, 7]
 
     """
-    intervals = []
-    if wrap:
-        pitches += [pitches[0]]
-    for i in range(1, len(pitches)):
-        i = pitches[i] - pitches[i - 1]
-        if mod_12:
-            i %= 12
-        intervals.append(i)
-
-    return intervals
+    pitches = list(pitches)
+    following = pitches[1:] + pitches[:1] if wrap else pitches[1:]
+    if mod_12:
+        return [(b - a) % 12 for a, b in zip(pitches, following)]
+    return [b - a for a, b in zip(pitches, following)]
 
 
 def rotate(pitches: Iterable, steps: int = 1) -> list:
@@ -222,11 +204,10 @@ def rotate(pitches: Iterable, steps: int = 1) -> list:
 
 
     """
-    list_len = len(pitches)
-    if steps > list_len:
-        steps = steps % list_len
-    result = pitches[steps:] + pitches[:steps]
-    return result
+    pitches = list(pitches)
+    if steps > len(pitches):
+        steps %= len(pitches)
+    return pitches[steps:] + pitches[:steps]
 
 
 def every_nth(pitches: list, start_index: int = 0, step_size: int = 5) -> list:
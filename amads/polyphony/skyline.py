@@ -42,15 +42,14 @@ def skyline(score: Score, threshold: float = 0.1):
         Score: A new score containing the "skyline" notes
     """
 
-    score = score.merge_tied_notes()
     new_score = score.emptycopy()
     skyline = Part(parent=new_score)
-    notes = score.get_sorted_notes()
+    notes = score.get_sorted_notes()  # merges tied notes in a copy
 
     # Algorithm: the basic idea is to scan notes and copy them
     # to skyline, a Part object. We can use shallow copy
-    # because notes are already deep copied from score after
-    # merge_tied_notes.
+    # because notes are already deep copied from score by
+    # get_sorted_notes.
     #
     # In the outer looop, we test each note to see if it is below
     # the skyline as it exists so far. Since we process in order,
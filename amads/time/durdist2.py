@@ -11,6 +11,7 @@ Description:
 Dependencies:
     - amads
     - math
+    - numpy
 
 Usage:
     [Add basic usage examples or import statements]
@@ -21,49 +22,52 @@ Original doc: https://citeseerx.ist.psu.edu/document?repid=rep1&type=pdf&doi=6e0
 import math
 from typing import List, Union
 
-from ..core.basics import Note, Score
+import numpy as np
+
+from ..core.basics import Score
 from ..core.distribution import Distribution
 from ..pitch.ismonophonic import ismonophonic
 
+# Edges of the default bins: bin k holds durations between
+# DEFAULT_BIN_EDGES[k] and DEFAULT_BIN_EDGES[k + 1], i.e. durations
+# that round to k - 4 on a scale of 2 * log2(duration).
+DEFAULT_BIN_EDGES = np.exp2((np.arange(10) - 4.5) / 2)
+
 
 def update_dd(
-    dd: List[List[float]],
+    dd: np.ndarray,
     bin_boundaries: Union[None, List[float]],
-    prev_bin: int,
-    note: Note,
-) -> int:
+    durations: np.ndarray,
+) -> None:
     """Updates the duration distribution matrix based on the given notes.
 
     Serves as a helper function for `duration_distribution_2`.
 
     Args:
-        dd (List[List[float]]): The duration distribution matrix to be updated.
+        dd (np.ndarray): The duration distribution matrix to be updated.
         bin_boundaries (Union[None, List[float]]): The boundaries of the bins
             or None to use default bins.
-        prev_bin (int): The previous bin index.
-        note (Note): The note to be processed.
-
-    Returns:
-        int bin number for Note if Note was used to add a count to dd, else None
-        (which become prev_bin on the next call and is used to control whether
-        the *next* note provides a count to dd).
+        durations (np.ndarray): The durations of a sequence of notes. Each
+            pair of consecutive durations adds a count to dd unless either
+            duration falls outside the bins. Several sequences can be
+            processed at once by separating them with NaN.
     """
+    n = len(dd)
     if bin_boundaries:
-        for bin, boundary in enumerate(bin_boundaries):
-            if note.duration <= boundary:
-                break
-        else:
-            bin = len(bin_boundaries) - 1
+        bins = np.searchsorted(bin_boundaries, durations)
+        valid = ~np.isnan(durations)
     else:
-        if note.duration <= 0:
-            return None
-        bin = round(2 * math.log2(note.duration)) + 4
-        if bin < 0 or bin > 8:
-            return None
+        # durations outside the edges (and NaN, which sorts last) get
+        # bin -1 or 9 and are ignored. Viewed as unsigned, -1 is larger
+        # than 8, so one comparison tests 0 <= bin <= 8.
+        bins = np.searchsorted(DEFAULT_BIN_EDGES, durations, side="right") - 1
+        valid = bins.view(np.uintp) <= 8
 
-    if prev_bin is not None:
-        dd[prev_bin][bin] += 1
-    return bin
+    # pairs with an invalid bin are masked out, so their (meaningless)
+    # indices need not be clamped
+    pairs = valid[:-1] & valid[1:]
+    counts = np.bincount((bins[:-1] * n + bins[1:])[pairs], minlength=n * n)
+    dd += counts.reshape(n, n)
 
 
 def duration_distribution_2(
@@ -119,7 +123,6 @@ def duration_distribution_2(
 
     bin_boundaries = None
     if bin_centers:
-        dd = [[0] * len(bin_centers) for _ in range(len(bin_centers))]
         bin_boundaries = [
             math.sqrt(bin_centers[i] * bin_centers[i + 1])
             for i in range(len(bin_centers) - 1)
@@ -137,12 +140,16 @@ def duration_distribution_2(
             "2.83",
             "whole",
         ]
-        dd = [[0] * 9 for _ in range(9)]
+    n = len(x_categories)
+    dd = np.zeros((n, n))
 
+    # Gather the durations of all containers into one array, separated
+    # by NaN so that no pair spans two containers, and count them at once.
+    durations = []
     for container in score.note_containers():
-        prev_bin = None
-        for note in container.find_all(Note):
-            prev_bin = update_dd(dd, bin_boundaries, prev_bin, note)
+        durations += [container.note_arrays().duration, [math.nan]]
+    if durations:
+        update_dd(dd, bin_boundaries, np.concatenate(durations))
 
     # TODO: I believe if score has tied notes, they will be treated
     # separately rather than joined to form a single duration. I do
@@ -150,9 +157,10 @@ def duration_distribution_2(
     # find all notes either way. -RBD
 
     # normalize
-    total = sum([sum(row) for row in dd])
+    total = dd.sum()
     if total > 0:
-        dd = [[i / total for i in row] for row in dd]
+        dd /= total
+    dd = dd.tolist()
 
     return Distribution(
         name,
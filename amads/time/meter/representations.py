@@ -15,6 +15,7 @@ within-cycle notational conventions).
 __author__ = "Mark Gotham"
 
 import math
+from functools import lru_cache
 from typing import Optional, Union
 
 import numpy as np
@@ -765,16 +766,9 @@ class PulseLengths:
         [0.0, 1.0, 2.0, 3.0]
 
         """
-        starts = []
-        count = 0
-        while count < self.cycle_length:
-            starts.append(round(float(count), 4))
-            count += pulse_length
-
-        if self.include_cycle_length:
-            starts.append(round(float(count), 4))
-
-        return starts
+        return list(
+            _pulse_starts(pulse_length, self.cycle_length, self.include_cycle_length)
+        )
 
     def to_array(self):
         """
@@ -812,6 +806,28 @@ class PulseLengths:
         return symbolic_pulse_length_array
 
 
+@lru_cache(maxsize=256)
+def _pulse_starts(
+    pulse_length: float, cycle_length: float, include_cycle_length: bool
+) -> tuple[float, ...]:
+    """
+    Cached body of `PulseLengths.one_pulse_to_start_hierarchy_list`.
+    The same few pulse and cycle lengths recur across time signatures and
+    their faster levels, so each level is computed once.
+    Returns a tuple: callers copy it to a list before handing it out.
+    """
+    starts = []
+    count = 0
+    while count < cycle_length:
+        starts.append(round(float(count), 4))
+        count += pulse_length
+
+    if include_cycle_length:
+        starts.append(round(float(count), 4))
+
+    return tuple(starts)
+
+
 class BeatPattern:
     """
     Encoding only the part of a metrical structure identified as the beat pattern.
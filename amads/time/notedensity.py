@@ -9,7 +9,9 @@ Original Doc: https://citeseerx.ist.psu.edu/document?repid=rep1&type=pdf&doi=6e0
 
 from typing import Optional
 
-from ..core.basics import Score
+import numpy as np
+
+from ..core.basics import Note, Score
 
 __author__ = "Tai Nakamura"
 
@@ -58,27 +60,34 @@ def notedensity(score: Score, timetype: Optional[str] = "quarters") -> float:
     >>> notedensity(score, timetype='quarters')
     0.5
     """
-    notes = score.get_sorted_notes()
-    if not notes:
+    notes = score.list_all(Note)
+    # A note that another note is tied to only continues it, so the notes
+    # counted are those that get_sorted_notes() would return after merging
+    # ties. Only the count and the first and last onsets are needed, so
+    # read them from an array rather than copying and sorting the score.
+    tied_to = {note.tie for note in notes if note.tie is not None}
+    onsets = np.fromiter(
+        (note.onset for note in notes if note not in tied_to), np.float64
+    )
+    if len(onsets) == 0:
         return 0.0
+    first, last = onsets.min(), onsets.max()
 
     if timetype == "seconds":
         if score.units_are_seconds:
-            start_onset = notes[0].onset
-            end_onset = notes[-1].onset
+            start_onset, end_onset = first, last
         else:
-            start_onset = score.time_map.beat_to_time(notes[0].onset)
-            end_onset = score.time_map.beat_to_time(notes[-1].onset)
+            start_onset = score.time_map.beat_to_time(first)
+            end_onset = score.time_map.beat_to_time(last)
     elif timetype == "quarters":
         if score.units_are_seconds:
-            start_onset = score.time_map.time_to_beat(notes[0].onset)
-            end_onset = score.time_map.time_to_beat(notes[-1].onset)
+            start_onset = score.time_map.time_to_beat(first)
+            end_onset = score.time_map.time_to_beat(last)
         else:
-            start_onset = notes[0].onset
-            end_onset = notes[-1].onset
+            start_onset, end_onset = first, last
     else:
         raise ValueError(f"Invalid timetype: {timetype}. Use 'quarters' or 'seconds'.")
     duration = end_onset - start_onset
     if duration <= 0:
         return 0.0
-    return (len(notes) - 1) / duration
+    return float((len(onsets) - 1) / duration)
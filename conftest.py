@@ -1,3 +1,9 @@
+import matplotlib
+
+# Render plots with the non-interactive Agg backend so that plt.show()
+# in the package, demos and tests never opens a window or blocks.
+matplotlib.use("Agg")
+
 # This tells pytest not to try and collect tests from demos, docs, examples, or tests_to_fix.
 # Note that the demos are tested separately in tests/test_demos.py.
 collect_ignore = ["demos", "docs", "examples", "tests_to_fix"]
@@ -1,6 +1,7 @@
 import matplotlib.pyplot as plt
 
 from amads.all import import_midi, pcdist1
+from amads.core.pitch import PITCH_CLASS_NAMES
 from amads.music import example
 
 # for some reason, could not open file with just the relative path
@@ -18,8 +19,7 @@ pcd = pcdist1(myscore)
 print(pcd)
 
 # Plot the pitch-class distribution
-pitch_classes = ["C", "C#", "D", "D#", "E", "F", "F#", "G", "G#", "A", "A#", "B"]
-plt.bar(pitch_classes, pcd, color="skyblue")
+plt.bar(PITCH_CLASS_NAMES, pcd, color="skyblue")
 plt.xlabel("Pitch Class")
 plt.ylabel("Probability")
 plt.title("Pitch-Class Distribution")
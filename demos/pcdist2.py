@@ -4,6 +4,7 @@ import matplotlib.pyplot as plt
 import numpy as np
 
 from amads.all import import_midi, pcdist2
+from amads.core.pitch import PITCH_CLASS_NAMES
 from amads.music import example
 
 # "midi/tones.mid"
@@ -30,8 +31,7 @@ plt.xlabel("Pitch Class (to)")
 plt.ylabel("Pitch Class (from)")
 plt.title("2nd Order Pitch-Class Distribution")
 
-pitch_classes = ["C", "C#", "D", "D#", "E", "F", "F#", "G", "G#", "A", "A#", "B"]
-plt.xticks(range(12), pitch_classes)
-plt.yticks(range(12), pitch_classes)
+plt.xticks(range(12), PITCH_CLASS_NAMES)
+plt.yticks(range(12), PITCH_CLASS_NAMES)
 
 plt.show()
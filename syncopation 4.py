@@ -10,6 +10,7 @@ from typing import Optional
 
 
 
+import numpy as np
 from partitura import load_score
 
 from amads.core.vectors_sets import vector_to_multiset
@@ -35,20 +36,30 @@ class SyncopationMetric:
         self.note_array = (
             None  # TODO. TBC. May be redundant / better handled on a per-metric basis.
         )
+        # Beat data from the note array, extracted once and shared by all metrics.
+        self._onsets = None
+        self._durations = None
+        self._ends = None
 
     def score_to_note_array(self):
         """
         Parse a score and return Partitura's `.note_array()` with `include_metrical_position=True`.
         This should cover the required information.
         """
-        if self.note_array is not None:
-            print("already retrieved, skipping")
+        if self.note_array is not None:  # already retrieved
             return
         if self.path_to_score is None:
             raise ValueError("No score provided.")
         else:
             score = load_score(self.path_to_score)
             self.note_array = score.note_array(include_metrical_position=True)
+            self._onsets = np.ascontiguousarray(
+                self.note_array["onset_beat"], dtype=np.float64
+            )
+            self._durations = np.ascontiguousarray(
+                self.note_array["duration_beat"], dtype=np.float64
+            )
+            self._ends = self._onsets + self._durations
 
     def keith(
         self,
@@ -103,43 +114,28 @@ class SyncopationMetric:
                         "To use user-provided data, we require onsets and one of ends or durations."
                     )
                 else:
-                    end_beats = [
-                        onset_beats[i] + duration_beats[i]
-                        for i in range(len(onset_beats))
-                    ]
+                    end_beats = np.add(onset_beats, duration_beats, dtype=np.float64)
 
         else:  # seek a score on the class
             if self.path_to_score is not None:
                 self.score_to_note_array()
-                onset_beats = [x["onset_beat"] for x in self.note_array]
-                duration_beats = [x["duration_beat"] for x in self.note_array]
-                end_beats = [
-                    onset_beats[i] + duration_beats[i] for i in range(len(onset_beats))
-                ]
+                onset_beats = self._onsets
+                end_beats = self._ends
                 # TODO revisit class handling of this retrieval step when more algorithms are in
             else:
                 raise ValueError("No score or user values provided.")
 
-        per_note_syncopation_values = (
-            []
-        )  # TODO. Currently, in case we want to report on the sequence, not just the sum
+        start = np.asarray(onset_beats, dtype=np.float64)
+        end = np.asarray(end_beats, dtype=np.float64)
 
-        for i in range(len(onset_beats)):
-            start = onset_beats[i]
-            end = end_beats[i]
+        # The 0/1/2/3 values above sum to the number of starts off the beat
+        # plus twice the number of ends off the beat, so count those directly.
+        # TODO. Per-note values are start_off | (end_off << 1) if we want to
+        # report on the sequence, not just the sum.
+        start_off = np.count_nonzero(np.floor(start) != start)
+        end_off = np.count_nonzero(np.floor(end) != end)
 
-            if abs(round(start) - start) == 0:  # start on the beat ...
-                if int(end) == end:  # ... and end on.
-                    per_note_syncopation_values.append(0)
-                else:  # ... but end off.
-                    per_note_syncopation_values.append(2)
-            else:  # start off the beat ...
-                if int(end) == end:  # ... but end on.
-                    per_note_syncopation_values.append(1)
-                else:  # ... and end off
-                    per_note_syncopation_values.append(3)
-
-        return sum(per_note_syncopation_values)
+        return start_off + 2 * end_off
 
     def weighted_note_to_beat_distance(
         self, onset_beats: Optional[list] = None
@@ -195,36 +191,36 @@ class SyncopationMetric:
         ):  # Required for user-provided, if not seek a score on the class
             if self.path_to_score is not None:
                 self.score_to_note_array()
-                onset_beats = [x["onset_beat"] for x in self.note_array]
+                onset_beats = self._onsets
                 # TODO revisit class handling of this retrieval when more algos are in
             else:
                 raise ValueError("No score or user values provided.")
 
-        per_note_syncopation_values = []
-
-        durations = [j - i for i, j in zip(onset_beats[:-1], onset_beats[1:])]
+        onsets = np.asarray(onset_beats, dtype=np.float64)
+        ends = onsets[1:]  # i.e. onset + duration
+        onsets = onsets[:-1]
         # Sic, although Partitura note_array provides durations, we're using INI here.
 
-        for i in range(len(durations)):
-            onset = onset_beats[i]
-            if int(onset) == onset:  # starts on a beat
-                per_note_syncopation_values.append(0)
-            else:
-                duration = durations[i]
-                this_beat_int = int(onset)  # NB round down
-                if onset + duration <= this_beat_int + 1:  # ends before or at e_{i+1}
-                    numerator = 1
-                elif onset + duration <= this_beat_int + 2:  # ends before or at e_{i+2}
-                    numerator = 2
-                else:  # if onset + duration > this_beat_int + 2: # ends after e_{i+2}
-                    numerator = 1
-
-                distance_to_nearest_beat = abs(round(onset) - onset)
-                per_note_syncopation_values.append(
-                    Fraction(numerator / distance_to_nearest_beat)
-                )
+        # Notes starting on a beat count 0, so only those off the beat are computed.
+        fraction, this_beat_int = np.modf(onsets)  # NB round down
+        off_beat = fraction != 0
+        fraction = np.abs(fraction[off_beat])
+        this_beat_int = this_beat_int[off_beat]
+        ends = ends[off_beat]
+        # 2 if ends after e_{i+1} but before or at e_{i+2}, otherwise 1
+        numerators = 1 + ((ends > this_beat_int + 1) & (ends <= this_beat_int + 2))
+        distances_to_nearest_beat = np.minimum(fraction, 1 - fraction)
+        # The values repeat across notes, so each distinct value is converted
+        # to a Fraction once and weighted by its count to sum exactly.
+        values, counts = np.unique(
+            numerators / distances_to_nearest_beat, return_counts=True
+        )
+        total = sum(
+            Fraction(value) * count
+            for value, count in zip(values.tolist(), counts.tolist())
+        )
 
-        return sum(per_note_syncopation_values) / (len(per_note_syncopation_values) + 1)
+        return total / (len(off_beat) + 1)
 
 
 def vector_to_onset_beat(vector: list, beat_unit_length: int = 2):
@@ -238,8 +234,9 @@ def vector_to_onset_beat(vector: list, beat_unit_length: int = 2):
     (0.0, 0.75, 1.5, 2.5, 3.0, 4.0)
 
     """
-    onsets = [i for i, count in enumerate(vector) for _ in range(count)]
-    return tuple(x / beat_unit_length for x in onsets)
+    counts = np.asarray(vector, dtype=np.int64)
+    onsets = np.repeat(np.arange(counts.size), counts)
+    return tuple((onsets / beat_unit_length).tolist())
 
 
 # -----------------------------------------------------------------------------
@@ -1,27 +1,48 @@
+import os
+from functools import lru_cache
+
 import matplotlib.pyplot as plt
 from pytest import fixture
 
+from amads.core.basics import Score
 from amads.io.readscore import import_midi
 from amads.music import example
 
 
-@fixture
-def twochan_score():
-    midi_file = example.fullpath("midi/twochan.mid")
-    return import_midi(midi_file, show=True).quantize(4)
+@lru_cache(maxsize=32)
+def _cached_import_midi(path: str, mtime: float) -> Score:
+    """Import a MIDI file once per (path, mtime); callers must copy the result."""
+    return import_midi(path, show=bool(os.getenv("AMADS_VERBOSE")))
+
+
+def import_midi_copy(midi_file) -> Score:
+    """Return a fresh copy of the score in midi_file, importing it only once."""
+    path = os.path.abspath(midi_file)
+    return _cached_import_midi(path, os.path.getmtime(path)).copy()
+
+
+@fixture(scope="session")
+def twochan_score_raw():
+    """twochan.mid as imported; copy it before modifying it."""
+    return import_midi_copy(example.fullpath("midi/twochan.mid"))
+
+
+@fixture(scope="session")
+def twochan_score(twochan_score_raw):
+    """twochan.mid quantized to sixteenths."""
+    return twochan_score_raw.copy().quantize(4)
 
 
-@fixture
+@fixture(scope="session")
 def twochan_notes(twochan_score):
-    print("twochan_notes fixture gets score:")
-    score = twochan_score
-    score.show()
-    notes = score.get_sorted_notes()
-    print("twochan_notes fixture gets sorted notes:")
-    for note in notes:
-        note.show()
+    if os.getenv("AMADS_VERBOSE"):
+        print("twochan_notes fixture gets score:")
+        twochan_score.show()
     return twochan_score.get_sorted_notes()
 
 
-# Stop matplotlib plot.show() from blocking the tests
-plt.ion()
+@fixture(autouse=True)
+def close_figures():
+    """Release the figures each test creates."""
+    yield
+    plt.close("all")
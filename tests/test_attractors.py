@@ -10,12 +10,36 @@ import pytest
 from amads.time.meter import PulseLengths
 from amads.time.meter.attractor_tempos import MetricalSalience, log_gaussian
 
-
-@pytest.fixture
+_EXPECTED_ABSOLUTE_PULSES = np.array(
+    [
+        [2.4, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0],
+        [1.2, 0.0, 0.0, 0.0, 1.2, 0.0, 0.0, 0.0],
+        [0.6, 0.0, 0.6, 0.0, 0.6, 0.0, 0.6, 0.0],
+        [0.3, 0.3, 0.3, 0.3, 0.3, 0.3, 0.3, 0.3],
+    ]
+)
+
+_EXPECTED_CUMULATIVE = np.array(
+    [
+        2.342383,
+        0.604448,
+        1.604448,
+        0.604448,
+        2.208897,
+        0.604448,
+        1.604448,
+        0.604448,
+    ]
+)
+
+
+@pytest.fixture(scope="module")
 def metrical_salience_instance():
     """
     Provides a sample set of pulse lengths for testing
     and initialises an instance of MetricalSalience with them.
+    The instance computes its salience values on construction and
+    the tests only read it, so one instance is shared by the module.
     """
     pl = [4, 2, 1, 0.5]
     pls = PulseLengths(pulse_lengths=pl, cycle_length=4)
@@ -25,7 +49,7 @@ def metrical_salience_instance():
 
 def test_symbolic(metrical_salience_instance):
     """Tests the initialization of the MetricalSalience class."""
-    np.testing.assert_allclose(
+    np.testing.assert_array_equal(
         metrical_salience_instance.symbolic_pulses[0, :],
         np.array([4.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0]),
     )
@@ -33,22 +57,17 @@ def test_symbolic(metrical_salience_instance):
 
 def test_absolute_pulse_lengths(metrical_salience_instance):
     np.testing.assert_allclose(
-        metrical_salience_instance.absolute_pulses,
-        np.array(
-            [
-                [2.4, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0],
-                [1.2, 0.0, 0.0, 0.0, 1.2, 0.0, 0.0, 0.0],
-                [0.6, 0.0, 0.6, 0.0, 0.6, 0.0, 0.6, 0.0],
-                [0.3, 0.3, 0.3, 0.3, 0.3, 0.3, 0.3, 0.3],
-            ]
-        ),
+        metrical_salience_instance.absolute_pulses, _EXPECTED_ABSOLUTE_PULSES
     )
 
 
 def test_get_salience_values(metrical_salience_instance):
     """Tests the `calculate_salience_values` method."""
-    metrical_salience_instance.calculate_salience_values()
-    assert metrical_salience_instance.salience_values.shape == (4, 8)
+    salience_values = metrical_salience_instance.calculate_salience_values()
+    assert salience_values.shape == (4, 8)
+    np.testing.assert_array_equal(
+        salience_values, metrical_salience_instance.salience_values
+    )
 
 
 def test_get_cumulative_salience_values(metrical_salience_instance):
@@ -57,18 +76,7 @@ def test_get_cumulative_salience_values(metrical_salience_instance):
     assert metrical_salience_instance.cumulative_salience_values.shape == (8,)
     np.testing.assert_allclose(
         metrical_salience_instance.cumulative_salience_values,
-        np.array(
-            [
-                2.342383,
-                0.604448,
-                1.604448,
-                0.604448,
-                2.208897,
-                0.604448,
-                1.604448,
-                0.604448,
-            ]
-        ),
+        _EXPECTED_CUMULATIVE,
         atol=1e-06,
     )
 
@@ -78,7 +86,6 @@ def test_plot(metrical_salience_instance):
     plt, fig = metrical_salience_instance.plot(symbolic_not_absolute=True)
     plt.close(fig)
 
-    metrical_salience_instance.calculate_salience_values()
     plt, fig = metrical_salience_instance.plot(symbolic_not_absolute=False)
     plt.close(fig)
 
@@ -33,10 +33,15 @@ ENCODED_SEQUENCES = [
 ENCODED_SIZES = [1, 3, 6, 3, 7]
 ENCODED_PROPORTIONAL_SIZES = [1, 1, 2 / 3, 3 / 8, 7 / 9]
 
-
-@pytest.mark.parametrize(
-    "to_encode,to_decode", zip(DECODED_SEQUENCES, ENCODED_SEQUENCES)
+# Cases zipped once at import. The expected values stay lists, the
+# type lz77_encode and lz77_decode return.
+ENCODE_DECODE_CASES = tuple(zip(DECODED_SEQUENCES, ENCODED_SEQUENCES))
+COMPLEXITY_CASES = tuple(
+    zip(DECODED_SEQUENCES, ENCODED_SIZES, ENCODED_PROPORTIONAL_SIZES)
 )
+
+
+@pytest.mark.parametrize("to_encode,to_decode", ENCODE_DECODE_CASES)
 def test_lz77_encode_decode(to_encode, to_decode):
     # Encode and decode the sequence
     encoded = lz77_encode(to_encode)
@@ -47,17 +52,12 @@ def test_lz77_encode_decode(to_encode, to_decode):
     assert decoded == to_encode
 
 
-@pytest.mark.parametrize(
-    "to_encode,size,size_proportional",
-    zip(DECODED_SEQUENCES, ENCODED_SIZES, ENCODED_PROPORTIONAL_SIZES),
-)
-def test_lz77_complexity(to_encode, size, size_proportional):
-    # Encode and get raw complexity
-    actual = lz77_complexity(to_encode, normalized=False)
-    assert actual == size
-    # Encode and get normalized complexity
-    actual_proportional = lz77_complexity(to_encode, normalized=True)
-    assert actual_proportional == size_proportional
+@pytest.mark.parametrize("normalized", [False, True])
+@pytest.mark.parametrize("to_encode,size,size_proportional", COMPLEXITY_CASES)
+def test_lz77_complexity(to_encode, size, size_proportional, normalized):
+    # Encode once and get the raw or normalized complexity
+    actual = lz77_complexity(to_encode, normalized=normalized)
+    assert actual == (size_proportional if normalized else size)
 
 
 def test_bad_sequence():
@@ -0,0 +1,42 @@
+"""Test suite for functions in amads.time.durdist2"""
+
+from amads.core.basics import Note, Part, Score
+from amads.time.durdist2 import duration_distribution_2
+
+
+def test_durdist2_default_bins():
+    score = Score.from_melody(
+        pitches=[60, 62, 64, 65, 67],
+        durations=[1.0, 0.5, 0.5, 8.0, 4.0],
+        iois=[1.0, 0.5, 0.5, 8.0],
+    )
+    dd = duration_distribution_2(score).data
+    # the 8-quarter note is out of range, so only two pairs are counted
+    expected = [[0.0] * 9 for _ in range(9)]
+    expected[4][2] = 0.5  # quarter -> eighth
+    expected[2][2] = 0.5  # eighth -> eighth
+    assert dd == expected
+
+
+def test_durdist2_bin_centers():
+    score = Score.from_melody(
+        pitches=[60, 62, 64, 65],
+        durations=[1.0, 0.5, 0.5, 4.0],
+        iois=[1.0, 0.5, 0.5],
+    )
+    dd = duration_distribution_2(score, bin_centers=[0.5, 1.0, 2.0]).data
+    # durations above the upper boundary fall in the last bin
+    third = 1 / 3
+    assert dd == [[third, 0.0, third], [third, 0.0, 0.0], [0.0, 0.0, 0.0]]
+
+
+def test_durdist2_pairs_stay_within_parts():
+    score = Score()
+    # two parts, one after the other, so the score is still monophonic
+    for onset, duration in ((0.0, 1.0), (2.0, 0.5)):
+        part = Part(parent=score, onset=onset)
+        for i in range(2):
+            Note(parent=part, onset=onset + i * duration, duration=duration)
+    dd = duration_distribution_2(score).data
+    assert dd[4][4] == 0.5 and dd[2][2] == 0.5
+    assert sum(map(sum, dd)) == 1.0
@@ -18,27 +18,48 @@ from amads.melody.fantastic import (
 __author__ = "David Whyatt"
 
 
-def test_fantastic_count_mtypes():
-    melody = Score.from_melody(
+# Melodies shared by several tests. Module scope is safe because none of
+# the feature functions mutate the score: each works on the deep-copied
+# notes of score.flatten(), so one instance serves the whole module.
+@pytest.fixture(scope="module")
+def sample_melody():
+    return Score.from_melody(
         pitches=[56, 58, 61, 58, 65, 65, 63],
         durations=[0.25, 0.25, 0.25, 0.25, 0.75, 0.75, 0.5],
     )
 
+
+@pytest.fixture(scope="module")
+def flat_melody():
+    return Score.from_melody(pitches=[60] * 5, durations=[1.0] * 5)
+
+
+@pytest.fixture(scope="module")
+def ascending_melody():
+    return Score.from_melody(pitches=[60, 62, 64, 65, 67, 72], durations=[1.0] * 6)
+
+
+@pytest.fixture(scope="module")
+def long_melody():
+    # four phrases, each ending with a longer note
+    return Score.from_melody(
+        pitches=[60, 62, 64, 60, 67, 67, 65, 64, 62, 62, 60, 60, 64, 64, 62, 60],
+        durations=[1.0, 1.0, 1.0, 2.0] * 4,
+    )
+
+
+def test_fantastic_count_mtypes(sample_melody):
     types = fantastic_count_mtypes(
-        melody, segment=False, phrase_gap=1.0, units="quarters"
+        sample_melody, segment=False, phrase_gap=1.0, units="quarters"
     )
     # FANTASTIC supports n-grams of lengths 1-5, so we check that we have n-grams of lengths 1-5
-    for i in range(1, 6):
-        assert any(len(ngram) == i for ngram in types.ngram_counts.keys())
+    lengths = {len(ngram) for ngram in types.ngram_counts}
+    assert {1, 2, 3, 4, 5} <= lengths
 
 
-def test_fantastic_interpolation_contour_features():
+def test_fantastic_interpolation_contour_features(sample_melody):
     # Test with a melody that generally increases in pitch
-    melody = Score.from_melody(
-        pitches=[56, 58, 61, 58, 65, 65, 63],
-        durations=[0.25, 0.25, 0.25, 0.25, 0.75, 0.75, 0.5],
-    )
-    features = fantastic_interpolation_contour_features(melody)
+    features = fantastic_interpolation_contour_features(sample_melody)
     assert features is not None
 
     # The melody tends to increase in pitch over time,
@@ -75,27 +96,9 @@ def test_fantastic_interpolation_contour_features():
     # Contour is shallow, so it is classified as cccc
     assert desc_features["class_label"] == "cccc"
 
-    # Test with a flat melody
-    flat = Score.from_melody(
-        pitches=[60, 60, 60, 60, 60], durations=[1.0, 1.0, 1.0, 1.0, 1.0]
-    )
-    flat_features = fantastic_interpolation_contour_features(flat)
-
-    # A flat melody should have:
-    assert flat_features["global_direction"] == 0  # No overall direction
-    assert flat_features["mean_gradient"] == 0.0  # No gradient
-    assert flat_features["gradient_std"] == 0.0  # No variation
-    assert flat_features["direction_changes"] == 0.0  # No changes
-    assert flat_features["class_label"] == "cccc"  # All same
-
 
-def test_fantastic_step_contour_features():
-    melody = Score.from_melody(
-        pitches=[56, 58, 61, 58, 65, 65, 63],
-        durations=[0.25, 0.25, 0.25, 0.25, 0.75, 0.75, 0.5],
-    )
-
-    features = fantastic_step_contour_features(melody)
+def test_fantastic_step_contour_features(sample_melody):
+    features = fantastic_step_contour_features(sample_melody)
     assert features is not None
 
     # The melody has several changes in direction
@@ -125,25 +128,40 @@ def test_fantastic_step_contour_features():
     # Low local variation (no direction changes)
     assert simple_features["local_variation"] < 0.5
 
-    # Test with a melody that stays on same pitch
-    flat_melody = Score.from_melody(
-        pitches=[60, 60, 60, 60, 60], durations=[1.0, 1.0, 1.0, 1.0, 1.0]
-    )
-
-    flat_features = fantastic_step_contour_features(flat_melody)
 
-    # A melody with no pitch changes should have:
-    # Zero global variation
-    assert flat_features["global_variation"] == 0
-    # Zero global direction
-    assert flat_features["global_direction"] == 0
-    # Zero local variation
-    assert flat_features["local_variation"] == 0
+# A melody that stays on the same pitch has no direction, gradient,
+# variation, range or entropy, whichever features are extracted.
+@pytest.mark.parametrize(
+    "feature_function,expected",
+    [
+        (
+            fantastic_interpolation_contour_features,
+            {
+                "global_direction": 0,
+                "mean_gradient": 0.0,
+                "gradient_std": 0.0,
+                "direction_changes": 0.0,
+                "class_label": "cccc",
+            },
+        ),
+        (
+            fantastic_step_contour_features,
+            {"global_variation": 0, "global_direction": 0, "local_variation": 0},
+        ),
+        (
+            fantastic_pitch_features,
+            {"pitch_range": 0, "pitch_std": 0, "pitch_entropy": 0},
+        ),
+    ],
+    ids=["interpolation_contour", "step_contour", "pitch"],
+)
+def test_fantastic_flat_melody(flat_melody, feature_function, expected):
+    features = feature_function(flat_melody)
+    assert {key: features[key] for key in expected} == expected
 
 
-def test_fantastic_parsons_contour_features():
-    melody = Score.from_melody(pitches=[60, 62, 64, 65, 67, 72], durations=[1.0] * 6)
-    features = fantastic_parsons_contour_features(melody)
+def test_fantastic_parsons_contour_features(ascending_melody):
+    features = fantastic_parsons_contour_features(ascending_melody)
     assert features is not None
 
     # The interval sequence should be [None, 2, 2, 1, 2, 5]
@@ -156,23 +174,24 @@ def test_fantastic_parsons_contour_features():
     assert features["as_string"] == "uuuuu"
 
     # We can also use the initial asterisk option
-    features = fantastic_parsons_contour_features(melody, initial_asterisk=True)
+    features = fantastic_parsons_contour_features(
+        ascending_melody, initial_asterisk=True
+    )
 
     # The string representation should be "*uuuuu"
     assert features["as_string"] == "*uuuuu"
 
     # We can also use a custom character dict
     features = fantastic_parsons_contour_features(
-        melody, character_dict={1: "^", 0: "->", -1: "v"}
+        ascending_melody, character_dict={1: "^", 0: "->", -1: "v"}
     )
 
     # The string representation should be "^^^^^"
     assert features["as_string"] == "^^^^^"
 
 
-def test_fantastic_polynomial_contour_features():
-    melody = Score.from_melody(pitches=[60, 62, 64, 65, 67, 72], durations=[1.0] * 6)
-    features = fantastic_polynomial_contour_features(melody)
+def test_fantastic_polynomial_contour_features(ascending_melody):
+    features = fantastic_polynomial_contour_features(ascending_melody)
     assert features is not None
 
     # We would expect the linear term to be positive
@@ -201,9 +220,8 @@ def test_fantastic_polynomial_contour_features():
     )
 
 
-def test_fantastic_huron_contour_features():
-    melody = Score.from_melody(pitches=[60, 62, 64, 65, 67, 72], durations=[1.0] * 6)
-    features = fantastic_huron_contour_features(melody)
+def test_fantastic_huron_contour_features(ascending_melody):
+    features = fantastic_huron_contour_features(ascending_melody)
     assert features is not None
 
     # The first pitch should be 60
@@ -220,15 +238,17 @@ def test_fantastic_huron_contour_features():
     assert features["contour_class"] == "Ascending-Ascending"
 
 
-def test_fantastic_mtype_summary_features():
-    melody = Score.from_melody(
-        pitches=[56, 58, 61, 58, 65, 65, 63],
-        durations=[0.25, 0.25, 0.25, 0.25, 0.75, 0.75, 0.5],
-    )
-
-    # Test with no segmentation first
+@pytest.mark.parametrize(
+    "melody,segment,phrase_gap",
+    [("sample_melody", False, 1.0), ("long_melody", True, 1.5)],
+    ids=["unsegmented", "segmented"],
+)
+def test_fantastic_mtype_summary_features(request, melody, segment, phrase_gap):
     features = fantastic_mtype_summary_features(
-        melody, segment=False, phrase_gap=1.0, units="quarters"
+        request.getfixturevalue(melody),
+        segment=segment,
+        phrase_gap=phrase_gap,
+        units="quarters",
     )
 
     # Verify all summary stats are present and have reasonable values
@@ -238,72 +258,16 @@ def test_fantastic_mtype_summary_features():
     assert 0 <= features["simpsons_d"] <= 1.0
     assert 0 <= features["sichels_s"] <= 1.0
 
-    # Honore's H should be incalculable for this melody
-    assert math.isnan(features["honores_h"])
-
-    # Test with a longer melody that can be segmented
-    long_melody = Score.from_melody(
-        pitches=[
-            60,
-            62,
-            64,
-            60,  # First phrase
-            67,
-            67,
-            65,
-            64,  # Second phrase
-            62,
-            62,
-            60,
-            60,  # Third phrase
-            64,
-            64,
-            62,
-            60,  # Fourth phrase
-        ],
-        durations=[
-            1.0,
-            1.0,
-            1.0,
-            2.0,  # First phrase with longer final note
-            1.0,
-            1.0,
-            1.0,
-            2.0,  # Second phrase
-            1.0,
-            1.0,
-            1.0,
-            2.0,  # Third phrase
-            1.0,
-            1.0,
-            1.0,
-            2.0,  # Fourth phrase
-        ],
-    )
-
-    # Test with segmentation
-    segmented_features = fantastic_mtype_summary_features(
-        long_melody, segment=True, phrase_gap=1.5, units="quarters"
-    )
-
-    # Features should still be in valid ranges
-    assert 0 <= segmented_features["mean_entropy"] <= 1.0
-    assert 0 <= segmented_features["mean_productivity"] <= 1.0
-    assert segmented_features["yules_k"] >= 0
-    assert 0 <= segmented_features["simpsons_d"] <= 1.0
-    assert 0 <= segmented_features["sichels_s"] <= 1.0
-
-    # Honore's H is calculable for this melody
-    assert segmented_features["honores_h"] >= 0
+    if segment:
+        # Honore's H is calculable for the segmented melody
+        assert features["honores_h"] >= 0
+    else:
+        # Honore's H should be incalculable for the short melody
+        assert math.isnan(features["honores_h"])
 
 
-def test_fantastic_pitch_features():
-    melody = Score.from_melody(
-        pitches=[56, 58, 61, 58, 65, 65, 63],
-        durations=[0.25, 0.25, 0.25, 0.25, 0.75, 0.75, 0.5],
-    )
-
-    features = fantastic_pitch_features(melody)
+def test_fantastic_pitch_features(sample_melody):
+    features = fantastic_pitch_features(sample_melody)
     assert features is not None
 
     # The melody has a range of 9
@@ -315,17 +279,6 @@ def test_fantastic_pitch_features():
     # Entropy should be between 0 and 1 since it's normalized by log2(24)
     assert 0 <= features["pitch_entropy"] <= 1.0
 
-    # Test with a melody that has all the same pitch
-    flat_melody = Score.from_melody(
-        pitches=[60, 60, 60, 60, 60], durations=[1.0, 1.0, 1.0, 1.0, 1.0]
-    )
-    flat_features = fantastic_pitch_features(flat_melody)
-
-    # A melody with all same pitches should have:
-    assert flat_features["pitch_range"] == 0  # No range
-    assert flat_features["pitch_std"] == 0  # No variation
-    assert flat_features["pitch_entropy"] == 0  # Minimum entropy
-
     # Test with a chromatic scale
     chromatic = Score.from_melody(
         pitches=[60, 61, 62, 63, 64, 65, 66, 67, 68, 69, 70, 71], durations=[1.0] * 12
@@ -339,13 +292,8 @@ def test_fantastic_pitch_features():
     assert chrom_features["pitch_entropy"] > 0.5
 
 
-def test_fantastic_pitch_interval_features():
-    melody = Score.from_melody(
-        pitches=[56, 58, 61, 58, 65, 65, 63],
-        durations=[0.25, 0.25, 0.25, 0.25, 0.75, 0.75, 0.5],
-    )
-
-    features = fantastic_pitch_interval_features(melody)
+def test_fantastic_pitch_interval_features(sample_melody):
+    features = fantastic_pitch_interval_features(sample_melody)
     assert features is not None
 
     # The intervals in the melody are: [2, 3, -3, 7, 0, -2]
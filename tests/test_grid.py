@@ -6,6 +6,7 @@ __author__ = "Mark Gotham"
 
 from collections import Counter
 
+import numpy as np
 import pytest
 
 from amads.time.meter import grid, profiles
@@ -43,49 +44,58 @@ def test_tatum_proportion_threshold():
         )
 
 
-def test_BPSD():
-    """Tests all measure-relative values of the BPSD dataset"""
-    all_files = [
-        "op002No1_01",
-        "op002No2_01",
-        "op002No3_01",
-        "op007_01",
-        "op010No1_01",
-        "op010No2_01",
-        "op010No3_01",
-        "op013_01",
-        "op014No1_01",
-        "op014No2_01",
-        "op022_01",
-        "op026_01",
-        "op027No1_01",
-        "op027No2_01",
-        "op028_01",
-        "op031No1_01",
-        "op031No2_01",
-        "op031No3_01",
-        "op049No1_01",
-        "op049No2_01",
-        "op053_01",
-        "op054_01",
-        "op057_01",
-        "op078_01",
-        "op079_01",
-        "op081a_01",
-        "op090_01",
-        "op101_01",
-        "op106_01",
-        "op109_01",
-    ]
-    all_positions = []
-
-    bpsd = profiles.BPSD()
-    for file_name in all_files:
-        these_keys = getattr(bpsd, file_name).keys()
-        all_positions += list(these_keys)
-        for k in these_keys:
-            n, d = grid.approximate_fraction(k)
-            assert n < 200
-            assert d < 600
-
-    assert len(set(all_positions)) == len(set(bpsd.all.keys())) == 205
+ALL_FILES = (
+    "op002No1_01",
+    "op002No2_01",
+    "op002No3_01",
+    "op007_01",
+    "op010No1_01",
+    "op010No2_01",
+    "op010No3_01",
+    "op013_01",
+    "op014No1_01",
+    "op014No2_01",
+    "op022_01",
+    "op026_01",
+    "op027No1_01",
+    "op027No2_01",
+    "op028_01",
+    "op031No1_01",
+    "op031No2_01",
+    "op031No3_01",
+    "op049No1_01",
+    "op049No2_01",
+    "op053_01",
+    "op054_01",
+    "op057_01",
+    "op078_01",
+    "op079_01",
+    "op081a_01",
+    "op090_01",
+    "op101_01",
+    "op106_01",
+    "op109_01",
+)
+
+
+@pytest.fixture(scope="module")
+def bpsd():
+    return profiles.BPSD()
+
+
+@pytest.mark.parametrize("file_name", ALL_FILES)
+def test_BPSD_file(bpsd, file_name):
+    """Tests the measure-relative values of one BPSD file"""
+    keys = list(getattr(bpsd, file_name).keys())
+    fractions = np.array([grid.approximate_fraction(k) for k in keys]).reshape(-1, 2)
+    too_large = (fractions >= (200, 600)).any(axis=1)
+    assert not too_large.any(), [keys[i] for i in np.flatnonzero(too_large)]
+
+
+def test_BPSD_all_positions(bpsd):
+    """Tests that the BPSD files together cover all 205 positions"""
+    all_positions = set()
+    for file_name in ALL_FILES:
+        all_positions.update(getattr(bpsd, file_name).keys())
+
+    assert len(all_positions) == len(set(bpsd.all.keys())) == 205
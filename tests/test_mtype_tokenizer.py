@@ -53,7 +53,8 @@ def test_mtype_tokenizer():
     ngrams.count_ngrams(tokens, n=None)
     all_counts = ngrams.get_counts()
     # Test each n-gram length by comparing to individual n-gram counts
-    max_length = max(len(ngram) for ngram in all_counts)
+    max_length = ngrams.max_n
+    assert max_length == max(len(ngram) for ngram in all_counts)
     for n in range(1, max_length + 1):
         ngrams.reset()
         ngrams.count_ngrams(tokens, n=n)
@@ -102,7 +103,7 @@ def test_mtype_tokenizer():
     all_counts = ngrams.get_counts()
 
     # Test that we can't count n-grams longer than sequence
-    max_length = max(len(ngram) for ngram in all_counts)
+    max_length = ngrams.max_n
 
     # As the phrase length is 7 notes, the maximum length n-gram is 6
     assert max_length == 6
@@ -186,7 +187,32 @@ def test_ngram_counts():
     assert complex_ngrams.mean_productivity > simple_ngrams.mean_productivity
 
 
+def test_ngram_max_n():
+    ngrams = NGramCounter()
+    assert ngrams.max_n == 0
+
+    # Counting all lengths of a short sequence stops at its length
+    ngrams.count_ngrams(["a", "b", "c"])
+    assert ngrams.max_n == 3
+
+    # Asking for n-grams longer than the tokens counts nothing,
+    # so max_n still matches the longest n-gram stored
+    short_tokens = ["a", "b"]
+    with pytest.raises(ValueError):
+        ngrams.count_ngrams(short_tokens, n=len(short_tokens) + 2)
+    with pytest.raises(ValueError):
+        ngrams.count_ngrams(short_tokens, n=[1, len(short_tokens) + 2])
+    ngrams.count_ngrams([])
+    assert ngrams.max_n == 3
+    assert ngrams.max_n == max(len(ngram) for ngram in ngrams.get_counts())
+
+    ngrams.reset()
+    ngrams.count_ngrams(short_tokens)
+    assert ngrams.max_n == len(short_tokens)
+
+
 if __name__ == "__main__":
     test_mtype_tokenizer()
     test_mtype_encodings()
     test_ngram_counts()
+    test_ngram_max_n()
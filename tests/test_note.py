@@ -1,4 +1,5 @@
-from amads.core.basics import Note
+from amads.core.basics import Chord, Measure, Note, Part, Score, Staff
+from amads.core.pitch import Pitch
 
 
 def test_ties():
@@ -11,3 +12,51 @@ def test_ties():
     # but it's what the code looks like it's trying to do
     assert note_1.duration == 1.0
     assert note_1.tied_duration == 2.0
+
+
+def test_has_ties():
+    note_1 = Note(duration=1.0, pitch=60)
+    note_2 = Note(duration=1.0, pitch=60)
+    score = Score(Part(Staff(Measure(Chord(note_1)), Measure(note_2))))
+    assert score.has_chords() and score.has_measures()
+    assert not score.has_ties() and not score.has_rests()
+
+    note_1.tie = note_2
+    assert score.has_ties()
+
+
+def test_note_octave():
+    note = Note(pitch=Pitch("B#3"))
+    assert note.octave == 3
+    note.octave = 5
+    assert note.name_with_octave == "B#5"
+
+
+def test_merge_tied_notes():
+    note_1 = Note(duration=1.0, pitch=60)
+    note_2 = Note(duration=2.0, pitch=60)
+    note_3 = Note(duration=1.0, pitch=62)
+    note_1.tie = note_2
+    note_3.set("lyric_syllable", "la")
+    score = Score(Part(Staff(Measure(note_1, note_2, note_3))))
+    notes = score.flatten(collapse=True).content[0].content
+    assert [(n.key_num, n.duration) for n in notes] == [(60, 3.0), (62, 1.0)]
+    assert notes[0].tie is None and note_1.tie is note_2
+    assert notes[1].pitch is note_3.pitch
+    notes[1].set("lyric_syllable", "lo")
+    assert note_3.get("lyric_syllable") == "la"
+
+
+def test_merge_tied_notes_across_measures():
+    notes = [Note(duration=1.0, pitch=60) for _ in range(3)]
+    notes[0].tie = notes[1]
+    notes[1].tie = notes[2]
+    staff = Staff(
+        Measure(Note(duration=3.0, pitch=62), notes[0]),
+        Measure(notes[1], Note(duration=3.0, pitch=64)),
+        Measure(notes[2]),
+    )
+    merged = Score(Part(staff)).merge_tied_notes()
+    assert not merged.has_ties()
+    merged_notes = [(n.key_num, n.onset, n.duration) for n in merged.find_all(Note)]
+    assert merged_notes == [(62, 0, 3), (60, 3, 3), (64, 5, 3)]
@@ -74,3 +74,18 @@ def test_notedensity_default_timetype():
     score = Score.from_melody([60, 62, 64, 65])
     result = notedensity(score)  # default timetype='quarters'
     assert result == 1.0
+
+
+def test_notedensity_tied_notes():
+    """Tied notes count as one note, as in score.get_sorted_notes()"""
+    score = Score()
+    part = Part(parent=score)
+    first = Note(parent=part, onset=0.0, duration=1.0, pitch=60)
+    first.tie = Note(parent=part, onset=1.0, duration=1.0, pitch=60)
+    Note(parent=part, onset=2.0, duration=1.0, pitch=62)
+    Note(parent=part, onset=3.0, duration=1.0, pitch=64)
+
+    result = notedensity(score, timetype="quarters")
+    # merged onsets 0.0, 2.0, 3.0: (3-1) / 3.0
+    assert result == pytest.approx(2 / 3)
+    assert len(score.get_sorted_notes()) == 3
@@ -0,0 +1,20 @@
+"""Test suite for amads.pitch.pcdist1 and amads.pitch.pcdist2"""
+
+from amads.core.basics import Score
+from amads.pitch.pcdist1 import pcdist1
+from amads.pitch.pcdist2 import pcdist2
+
+
+def test_pcdist1():
+    score = Score.from_melody([60, 72, 62], durations=[2.0, 1.0, 1.0])
+    assert pcdist1(score) == [0.75, 0, 0.25] + [0] * 9
+    unweighted = pcdist1(score, weighted=False)
+    assert unweighted[0] == 2 / 3 and unweighted[2] == 1 / 3
+
+
+def test_pcdist2():
+    score = Score.from_melody([60, 62, 60], durations=[2.0, 1.0, 1.0])
+    pcd = pcdist2(score)
+    assert pcd[0][2] == 2 / 3 and pcd[2][0] == 1 / 3
+    pcd = pcdist2(score, weighted=False)
+    assert pcd[0][2] == 0.5 and pcd[2][0] == 0.5
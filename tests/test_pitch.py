@@ -1,3 +1,5 @@
+import pytest
+
 from amads.core.pitch import Pitch
 
 
@@ -6,6 +8,24 @@ def test_pitch_comparison():
     b_3 = Pitch(59, alt=0)
     c_4 = Pitch(60, alt=0)
     assert b_3 < c_4
+    # B#3 sounds as C4 but is spelled lower
+    assert Pitch("B#3") < c_4 and c_4 > Pitch("B#3")
+    # Dbb4 sounds as C4 but is spelled higher
+    assert Pitch("Dbb4") > c_4 and c_4 <= Pitch("Dbb4")
+    assert c_4 <= Pitch(60) and c_4 >= Pitch(60)
+
+
+def test_pitch_comparison_with_non_pitch():
+    c_4 = Pitch(60)
+    assert c_4 != 60
+    for compare in (
+        lambda: c_4 < 60,
+        lambda: c_4 <= 60,
+        lambda: c_4 > 60,
+        lambda: c_4 >= 60,
+    ):
+        with pytest.raises(TypeError):
+            compare()
 
 
 def test_non_int_pitch():
@@ -18,3 +38,29 @@ def test_meta_pitch():
     """Currently, Pitch accepts Pitch objects."""
     p = Pitch(60)
     Pitch(p)
+
+
+def test_pitch_equality_and_hash():
+    assert Pitch(61) == Pitch("C#4")
+    assert Pitch(61) != Pitch("Db4")
+    assert Pitch(60) == Pitch(60.0, alt=0.0)
+    assert hash(Pitch(60)) == hash(Pitch(60.0, alt=0.0))
+    assert len({Pitch(61), Pitch("C#4"), Pitch("Db4"), Pitch(60.5)}) == 3
+    assert Pitch(60) != 60
+
+
+def test_octave_and_register():
+    assert Pitch("B#3").octave == 3 and Pitch("B#3").register == 4
+    assert Pitch("Cb4").octave == 4 and Pitch("Cb4").register == 3
+    assert Pitch(59.5).register == 3 and isinstance(Pitch(59.5).register, int)
+    assert Pitch(59.5).octave == 3
+
+
+def test_enharmonics():
+    names = ["C4", "E4", "F4", "B3", "C#4", "Bb3"]
+    upper = [Pitch(n).upper_enharmonic().name for n in names]
+    assert upper == ["Dbb", "Fb", "Gbb", "Cb", "Db", "Cbb"]
+    lower = [Pitch(n).lower_enharmonic().name for n in names]
+    assert lower == ["B#", "D##", "E#", "A##", "B##", "A#"]
+    simplest = [Pitch(n).enharmonic().name for n in names]
+    assert simplest == ["B#", "Fb", "E#", "Cb", "Db", "A#"]
@@ -16,6 +16,8 @@ Source: Gotham and Yust, Serial Analyser, DLfM 2021
 https://github.com/MarkGotham/Serial_Analyser
 """
 
+import numpy as np
+
 from amads.pitch.serial import pair_swap_krenek, rotate_hexachords
 from amads.pitch.transformations import (
     invert,
@@ -39,9 +41,9 @@ def test_transpose():
 
 def test_rotate():
     luto = [0, 6, 5, 11, 10, 4, 3, 9, 8, 2, 1, 7]
-    for i in range(12):
-        row = rotate(luto, i)
-        assert row[0] == luto[i]
+    # row i of the expected matrix is luto rotated to start at luto[i]
+    expected = np.asarray(luto)[(np.arange(12)[:, None] + np.arange(12)) % 12]
+    np.testing.assert_array_equal([rotate(luto, i) for i in range(12)], expected)
 
 
 def test_invert():
@@ -54,6 +56,9 @@ def test_pitches_to_intervals():
     assert pitches_to_intervals(test_row_up) == [1] * 11
     test_row_down = test_row_up[::-1]
     assert pitches_to_intervals(test_row_down) == [11] * 11
+    assert pitches_to_intervals(test_row_up, wrap=True) == [1] * 12
+    assert len(test_row_up) == 12  # wrap does not extend the caller's list
+    assert pitches_to_intervals((0, 2, 5), wrap=True) == [2, 3, 7]
 
 
 def test_rotate_hexachords():
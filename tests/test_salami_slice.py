@@ -1,3 +1,5 @@
+import os
+
 from pytest import approx
 
 from amads.algorithms.slice.salami import Timepoint, salami_slice
@@ -9,13 +11,15 @@ def test_timepoints_twochan(twochan_notes):
 
 
 def test_salami_slice_twochan(twochan_score):
-    print("test_salami_slice_twochan(twochan_score): ")
-    twochan_score.show()
+    if os.getenv("AMADS_VERBOSE"):
+        print("test_salami_slice_twochan(twochan_score): ")
+        twochan_score.show()
     chords = salami_slice(twochan_score)
-    print("after salami_slice:", chords)
-    for chord in chords:
-        print("chord at ", chord.onset)
-        chord.show()
+    if os.getenv("AMADS_VERBOSE"):
+        print("after salami_slice:", chords)
+        for chord in chords:
+            print("chord at ", chord.onset)
+            chord.show()
     assert len(chords) == 16
 
     pitches = [[int(p.key_num) for p in c.content] for c in chords]
@@ -1,6 +1,19 @@
 import pytest
 
-from amads.core.basics import Note, Part, Score
+from amads.core.basics import (
+    Chord,
+    Concurrence,
+    Event,
+    EventGroup,
+    Measure,
+    Note,
+    Part,
+    Rest,
+    Score,
+    Sequence,
+    Staff,
+)
+from amads.core.pitch import Pitch
 
 
 def test_from_melody_overlapping_notes():
@@ -53,3 +66,139 @@ def test_parent():
     assert isinstance(note, Note)
     assert note.part == part
     assert note.score == score
+
+
+def test_find_all_matches_isinstance():
+    score = Score(Part(Staff(Measure(Note(), Chord(Note(), Note()), Rest()))))
+    for cls in (Event, EventGroup, Sequence, Concurrence, Note, Chord, Rest):
+        expected = []
+
+        def visit(group):
+            for elem in group.content:
+                if isinstance(elem, cls):
+                    expected.append(elem)
+                elif isinstance(elem, EventGroup):
+                    visit(elem)
+
+        visit(score)
+        assert list(score.find_all(cls)) == expected
+        assert score.list_all(cls) == expected
+
+
+def test_insert_out_of_order():
+    part = Part()
+    for onset in (0.0, 2.0, 4.0):
+        part.insert(Note(onset=onset))
+    part.insert(Note(onset=1.0, pitch=61))
+    part.insert(Note(onset=2.0, pitch=62))  # after the existing onset 2.0
+    assert [n.onset for n in part.content] == [0.0, 1.0, 2.0, 2.0, 4.0]
+    assert part.content[3].key_num == 62
+
+
+def test_is_measured_and_note_containers():
+    staff_1 = Staff(Measure(Note(), Chord(Note(), Note())), number=1)
+    staff_2 = Staff(Measure(Note(), Rest()), number=2)
+    score = Score(Part(staff_1, staff_2))
+    assert score.is_measured()
+    assert score.note_containers() == [staff_1, staff_2]
+
+    flat = score.flatten()
+    assert not flat.is_measured()
+    assert flat.note_containers() == [flat.content[0]]
+
+
+def test_last_offset():
+    staff = Staff()
+    assert staff.last_offset == 0
+    Note(parent=staff, onset=0.0, duration=1.0)
+    Note(parent=staff, onset=1.0, duration=2.0)
+    assert staff.last_offset == 3.0
+
+
+def test_pack():
+    staff = Staff(
+        Measure(Note(duration=1), Chord(Note(duration=2), Note(duration=3))),
+        Measure(Note(duration=2)),
+    )
+    assert staff.pack(onset=1.0) == 6.0
+    m1, m2 = staff.content
+    assert [m1.onset, m1.duration, m2.onset, m2.duration] == [1, 4, 5, 2]
+    chord = m1.content[1]
+    assert chord.onset == 2 and chord.duration == 3
+    assert [n.onset for n in chord.content] == [2, 2]
+
+
+def test_deep_copy():
+    n1 = Note(duration=1, pitch=60)
+    n2 = Note(duration=1, pitch=60)
+    n1.tie = n2
+    score = Score(Part(Staff(Measure(n1, n2))))
+    score.info = {"title": "x"}
+    copied = score.copy()
+    notes = list(copied.find_all(Note))
+    assert len(notes) == 2 and notes[0] is not n1
+    assert notes[0].tie is notes[1]
+    assert notes[0].pitch == n1.pitch
+    assert notes[0].parent.parent.parent.parent is copied
+    assert copied.info == score.info and copied.info is not score.info
+    assert copied._units_are_seconds == score._units_are_seconds
+
+
+def test_copy_numpy_times():
+    np = pytest.importorskip("numpy")
+    note = Note(onset=np.float64(1.5), duration=np.float64(0.5))
+    copied = note.copy()
+    assert copied.onset == 1.5 and type(copied.onset) is np.float64
+    assert copied.duration == 0.5
+
+
+def test_note_arrays():
+    chord = Chord(Note(pitch=64), Note(pitch=67))
+    score = Score(Part(Staff(Measure(Note(duration=2, pitch=60), chord))))
+    notes = score.note_arrays()
+    assert notes.onset.tolist() == [0, 2, 2]
+    assert notes.duration.tolist() == [2, 1, 1]
+    assert notes.key_num.tolist() == [60, 64, 67]
+    assert Score().note_arrays().onset.shape == (0,)
+
+
+def test_flatten_sort_order():
+    chord = Chord(
+        Note(pitch=64),
+        Note(pitch=Pitch("Db4")),
+        Note(pitch=Pitch("C#4")),
+        Note(pitch=60),
+    )
+    score = Score(Part(Staff(Measure(Note(pitch=72), chord))))
+    notes = score.flatten().content[0].content
+    assert [n.name_with_octave for n in notes] == ["C5", "C4", "C#4", "Db4", "E4"]
+
+
+def _two_part_score():
+    """A piano part with two staves and a flute part with one."""
+    return Score(
+        Part(
+            Staff(Measure(Note(pitch=60)), number=1),
+            Staff(Measure(Note(pitch=61)), number=2),
+            number=1,
+            instrument="piano",
+        ),
+        Part(Staff(Measure(Note(pitch=70)), number=1), number=2, instrument="flute"),
+    )
+
+
+@pytest.mark.parametrize(
+    "selection,key_nums",
+    [
+        ({}, [60, 61, 70]),
+        ({"part": 1}, [60, 61]),
+        ({"part": "flute"}, [70]),
+        ({"part": [1]}, [70]),
+        ({"part": 3}, []),
+        ({"part": 1, "staff": 2}, [61]),
+        ({"part": 1, "staff": [0]}, [60]),
+    ],
+)
+def test_collapse_parts_selection(selection, key_nums):
+    notes = _two_part_score().collapse_parts(**selection).content[0].content
+    assert [n.key_num for n in notes] == key_nums
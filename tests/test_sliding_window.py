@@ -1,3 +1,4 @@
+from collections import deque
 from typing import Iterable
 
 from pytest import approx
@@ -22,18 +23,20 @@ def test_sliding_window(twochan_score: Score, twochan_notes: Iterable[Note]):
         step=step,
         align="right",
     )
-    windows = list(windows)
+    # Only the first two and last windows are checked, so the rest are
+    # generated (to find where the windows stop) but not kept
+    first_slice = next(windows)
+    second_slice = next(windows)
+    (last_slice,) = deque(windows, maxlen=1)
 
-    first_slice = windows[0]
     assert first_slice.onset == approx(-4.0)
     assert first_slice.offset == approx(0.0)
     assert len(first_slice.content) == 0
 
-    last_slice = windows[-1]
     assert last_slice.onset == approx(last_note_off, abs=step * 3)
     assert len(last_slice.content) == 0
 
     # The second slice should include the score's opening two notes
-    assert len(windows[1].content) == 2
-    assert windows[1].content[0].key_num == 67 - 2 * 12
-    assert windows[1].content[1].key_num == 67
+    assert len(second_slice.content) == 2
+    assert second_slice.content[0].key_num == 67 - 2 * 12
+    assert second_slice.content[1].key_num == 67
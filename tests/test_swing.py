@@ -22,10 +22,12 @@ TEST_UPBEATS = [
     ],  # example 3: b1 + b4 skipped as two upbeats, b2 + b5 skipped as have no upbeat
 ]
 TEST_BURS = [[1.5, 2 / 3], [1.0, 0.25, 1.5, 1.0], [None, None, 0.5 / 0.6, None, None]]
+# Four evenly spaced beats, shared by the tests below
+FOUR_BEATS = (0.0, 1.0, 2.0, 3.0)
 
 
 @pytest.mark.parametrize(
-    "beats,upbeats,expecteds", zip(TEST_BEATS, TEST_UPBEATS, TEST_BURS)
+    "beats,upbeats,expecteds", list(zip(TEST_BEATS, TEST_UPBEATS, TEST_BURS))
 )
 def test_bur(beats, upbeats, expecteds):
     burs = beat_upbeat_ratio(beats, upbeats)
@@ -78,47 +80,28 @@ def test_validate_bur_inputs():
 
 
 def test_no_matches():
-    beats = [
-        0.0,
-        1.0,
-        2.0,
-        3.0,
-    ]
     upbeats = [5.0, 6.0, 7.0, 8.0]
     with pytest.raises(ValueError):
-        _ = beat_upbeat_ratio(beats, upbeats)
-
-
-def test_bounded_burs():
-    beats = [
-        0.0,
-        1.0,
-        2.0,
-        3.0,
-    ]
-    upbeats = [0.5, 1.5, 2.99]
-    expected = [1.0, 1.0, None]
-    actual = beat_upbeat_ratio(beats, upbeats, bounded=True)
-    assert pytest.approx(actual) == expected
+        _ = beat_upbeat_ratio(FOUR_BEATS, upbeats)
 
 
-def test_log2_burs():
-    beats = [0.0, 1.0, 2.0, 3.0]
-    upbeats = [1 / 3, 5 / 3, 2.5]
-    expected = [-1.0, 1.0, 0.0]
-    actual = beat_upbeat_ratio(beats, upbeats, log2=True)
+@pytest.mark.parametrize(
+    "upbeats,kwargs,expected",
+    [
+        pytest.param(
+            [0.5, 1.5, 2.99], {"bounded": True}, [1.0, 1.0, None], id="bounded"
+        ),
+        pytest.param([1 / 3, 5 / 3, 2.5], {"log2": True}, [-1.0, 1.0, 0.0], id="log2"),
+    ],
+)
+def test_bur_options(upbeats, kwargs, expected):
+    actual = beat_upbeat_ratio(FOUR_BEATS, upbeats, **kwargs)
     assert pytest.approx(actual) == expected
 
 
 def test_agg_funcs():
-    beats = [
-        0.0,
-        1.0,
-        2.0,
-        3.0,
-    ]
     upbeats = [0.5, 1.75, 2.8]
     mean = 8 / 3  # burs = [1., 3., 4.]
     sd = 1.247219
-    assert pytest.approx(mean_bur(beats, upbeats)) == mean
-    assert pytest.approx(std_bur(beats, upbeats)) == sd
+    assert pytest.approx(mean_bur(FOUR_BEATS, upbeats)) == mean
+    assert pytest.approx(std_bur(FOUR_BEATS, upbeats)) == sd
@@ -8,6 +8,16 @@ from amads.time.variability import (
     normalized_pairwise_variability_index,
     pairwise_anisochronous_contrast_index,
     phrase_normalized_pairwise_variability_index,
+    windowed_normalized_pairwise_variability_index,
+)
+
+# The rhythms in Figure 1 of Condit-Schultz (2019, p. 301)
+SCHULTZ_FIGURE_1 = (
+    [1.0, 1.0, 1.0, 1.0],
+    [1.0, 1 / 2, 1 / 2, 1.0, 1 / 2, 1 / 2],
+    [1.0, 1 / 2, 1.0, 1 / 2],
+    [3 / 2, 1 / 2, 3 / 2, 1 / 2],
+    [7 / 16, 1 / 16, 7 / 16, 1 / 16],
 )
 
 
@@ -71,19 +81,13 @@ def test_daniele_patel_2013_example_2():
     assert pytest.approx(actual, abs=1e-1) == expected
 
 
-def test_schultz_figure_1():
+@pytest.mark.parametrize(
+    "durations,expected", list(zip(SCHULTZ_FIGURE_1, [0.0, 40.0, 66.7, 100.0, 150.0]))
+)
+def test_schultz_figure_1(durations, expected):
     """Tests all the examples given in Figure 1 of Condit-Schultz (2019, p. 301)"""
-    all_durations = [
-        [1.0, 1.0, 1.0, 1.0],
-        [1.0, 1 / 2, 1 / 2, 1.0, 1 / 2, 1 / 2],
-        [1.0, 1 / 2, 1.0, 1 / 2],
-        [3 / 2, 1 / 2, 3 / 2, 1 / 2],
-        [7 / 16, 1 / 16, 7 / 16, 1 / 16],
-    ]
-    expected_results = [0.0, 40.0, 66.7, 100.0, 150.0]
-    for durations, expected in zip(all_durations, expected_results):
-        actual = normalized_pairwise_variability_index(durations)
-        assert pytest.approx(actual, abs=1e-1) == expected
+    actual = normalized_pairwise_variability_index(durations)
+    assert pytest.approx(actual, abs=1e-1) == expected
 
 
 def test_not_enough_durations():
@@ -102,38 +106,46 @@ def test_non_positive_durations():
         normalized_pairwise_variability_index([3.0, 3.0, -3.0, 2.0])
 
 
-def test_npvi_is_mean_npc():
+@pytest.mark.parametrize("dur", SCHULTZ_FIGURE_1)
+def test_npvi_is_mean_npc(dur):
     """According to Condit-Schultz (2019), the nPVI is equivalent to the mean nPC"""
-    all_durations = [
-        [1.0, 1.0, 1.0, 1.0],
-        [1.0, 1 / 2, 1 / 2, 1.0, 1 / 2, 1 / 2],
-        [1.0, 1 / 2, 1.0, 1 / 2],
-        [3 / 2, 1 / 2, 3 / 2, 1 / 2],
-        [7 / 16, 1 / 16, 7 / 16, 1 / 16],
+    # calculate nPVI using the "original" equation
+    x1 = normalized_pairwise_variability_index(dur)
+    # calculate nPVI as the mean nPC
+    x2 = normalized_pairwise_calculation(dur)
+    x2 = sum(x2) / len(x2)
+    # should be the same
+    assert pytest.approx(x1) == pytest.approx(x2)
+
+
+def test_windowed_npvi_matches_npvi():
+    """Tests that each window's nPVI equals the nPVI of that slice of durations"""
+    durations = [1.0, 1 / 2, 1 / 2, 1.0, 1 / 3, 1 / 3, 2.0, 1 / 3, 3 / 2, 1.0, 1 / 2]
+    windows = [(start, end) for start in range(10) for end in range(start + 2, 12)]
+    starts, ends = zip(*windows)
+    actual = windowed_normalized_pairwise_variability_index(durations, starts, ends)
+    expected = [
+        normalized_pairwise_variability_index(durations[start:end])
+        for start, end in windows
     ]
-    for dur in all_durations:
-        # calculate nPVI using the "original" equation
-        x1 = normalized_pairwise_variability_index(dur)
-        # calculate nPVI as the mean nPC
-        x2 = normalized_pairwise_calculation(dur)
-        x2 = sum(x2) / len(x2)
-        # should be the same
-        assert pytest.approx(x1) == pytest.approx(x2)
+    assert actual == pytest.approx(expected, abs=1e-9)
+
 
+def test_windowed_npvi_invalid_windows():
+    """Tests that windows with fewer than two durations or out of range raise errors"""
+    durations = [1.0, 2.0, 1.0, 2.0]
+    for starts, ends in [([0], [1]), ([-1], [2]), ([2], [5]), ([0, 1], [3])]:
+        with pytest.raises(ValueError):
+            windowed_normalized_pairwise_variability_index(durations, starts, ends)
 
-def test_isop():
+
+@pytest.mark.parametrize(
+    "dur,expected", list(zip(SCHULTZ_FIGURE_1, [1.0, 2 / 5, 0.0, 0.0, 0.0]))
+)
+def test_isop(dur, expected):
     """Tests the isochrony proportion function"""
-    all_durations = [
-        [1.0, 1.0, 1.0, 1.0],
-        [1.0, 1 / 2, 1 / 2, 1.0, 1 / 2, 1 / 2],
-        [1.0, 1 / 2, 1.0, 1 / 2],
-        [3 / 2, 1 / 2, 3 / 2, 1 / 2],
-        [7 / 16, 1 / 16, 7 / 16, 1 / 16],
-    ]
-    expecteds = [1.0, 2 / 5, 0.0, 0.0, 0.0]
-    for dur, expected in zip(all_durations, expecteds):
-        actual = isochrony_proportion(dur)
-        assert actual == expected
+    actual = isochrony_proportion(dur)
+    assert actual == expected
 
 
 def test_paci():
@@ -170,11 +182,7 @@ def test_paci():
         assert not pytest.approx(paci, abs=1e-1) == pytest.approx(npvi, abs=1e-1)
 
     # Test with examples that have no isochronous pairs, so should be identical to vanilla npvi
-    vanillas = [
-        [1.0, 1 / 2, 1.0, 1 / 2],
-        [3 / 2, 1 / 2, 3 / 2, 1 / 2],
-        [7 / 16, 1 / 16, 7 / 16, 1 / 16],
-    ]
+    vanillas = SCHULTZ_FIGURE_1[2:]
     expected_results = [66.7, 100.0, 150.0]
     for durs, expected in zip(vanillas, expected_results):
         # Calculate npvi and paci for these values
@@ -195,12 +203,7 @@ def test_paci():
 
 def test_pnpvi():
     """Tests the phrase-normalized pairwise variability index function"""
-    all_durations = [
-        [1.0, 1 / 2, 1 / 2, 1.0, 1 / 2, 1 / 2],
-        [1.0, 1 / 2, 1.0, 1 / 2],
-        [3 / 2, 1 / 2, 3 / 2, 1 / 2],
-        [7 / 16, 1 / 16, 7 / 16, 1 / 16],
-    ]
+    all_durations = SCHULTZ_FIGURE_1[1:]
     all_boundaries = [
         [1.9, 3.5],
         [1.4],
@@ -0,0 +1,18 @@
+"""Test suite for amads.core.timemap"""
+
+import numpy as np
+
+from amads.core.timemap import TimeMap
+
+
+def test_beat_to_time_array():
+    time_map = TimeMap(bpm=120)
+    time_map.append_beat_tempo(4, 60)
+    time_map.append_beat_tempo(6, 90)
+    beats = np.linspace(-1, 10, 45)
+    expected = [time_map.beat_to_time(beat) for beat in beats]
+    assert np.allclose(time_map.beat_to_time_array(beats), expected)
+
+    time_map.last_tempo = None  # extrapolate from the last two entries
+    expected = [time_map.beat_to_time(beat) for beat in beats]
+    assert np.allclose(time_map.beat_to_time_array(beats), expected)
@@ -6,12 +6,13 @@ from amads.music import example
 
 class TestUntils(unittest.TestCase):
 
-    def setUp(self):
-        """Set up the test case with example music files"""
+    @classmethod
+    def setUpClass(cls):
+        """Set up the test case with example music files, once for all tests"""
         # Example music files
-        self.midi_file = example.fullpath("midi/sarabande.mid")
-        self.xml_file = example.fullpath("musicxml/ex2.xml")
-        self.filenames = [str(self.midi_file), str(self.xml_file)]
+        cls.midi_file = example.fullpath("midi/sarabande.mid")
+        cls.xml_file = example.fullpath("musicxml/ex2.xml")
+        cls.filenames = [str(cls.midi_file), str(cls.xml_file)]
 
     def test_dir2coll(self):
         """Test the dir2coll function"""